@@ -19,8 +19,9 @@ import logging
 import os
 import pathlib
 import random
+import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 import asyncio
 
@@ -48,32 +49,45 @@ from a2a.types import (
 )
 
 from .gaia_loader import GAIALoader
-from .schemas import EvaluationResult, EvaluationSummary
+from .schemas import EvaluationResult, EvaluationSummary, GAIAQuestion
 from .scoring import GAIAScorer
 
+# Only emit ANSI escapes to an interactive terminal (https://no-color.org)
+_USE_COLOR = sys.stderr.isatty() and os.getenv("NO_COLOR") is None
+
 # ANSI color codes for clean logging
 class Colors:
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    MAGENTA = '\033[95m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    RESET = '\033[0m' if _USE_COLOR else ''
+
+# Styles and separators used on every log line, built once at import
+BOLD_CYAN = Colors.BOLD + Colors.CYAN
+RULE = '─' * 70
+_LEVEL_PREFIXES = {
+    level: f"{color}[{level}]{Colors.RESET}"
+    for level, color in (
+        ('DEBUG', Colors.CYAN),
+        ('INFO', Colors.GREEN),
+        ('WARNING', Colors.YELLOW),
+        ('ERROR', Colors.RED),
+        ('CRITICAL', Colors.RED + Colors.BOLD),
+    )
+}
 
 # Custom formatter with colors and clean format
 class CleanFormatter(logging.Formatter):
     def format(self, record):
-        level_colors = {
-            'DEBUG': Colors.CYAN,
-            'INFO': Colors.GREEN,
-            'WARNING': Colors.YELLOW,
-            'ERROR': Colors.RED,
-            'CRITICAL': Colors.RED + Colors.BOLD
-        }
-        color = level_colors.get(record.levelname, Colors.RESET)
-        level_prefix = f"{color}[{record.levelname}]{Colors.RESET}"
+        if not _USE_COLOR:
+            return f"[{record.levelname}] {record.getMessage()}"
+        level_prefix = _LEVEL_PREFIXES.get(record.levelname)
+        if level_prefix is None:
+            level_prefix = f"{Colors.RESET}[{record.levelname}]{Colors.RESET}"
         return f"{level_prefix} {record.getMessage()}"
 
 # Setup clean logging
@@ -149,7 +163,8 @@ class GAIAEvaluator:
         numerical_tolerance: float = 0.01,
         task_timeout: int = 120,
         use_llm_scoring: bool = False,
-        llm_model: str = "gemini-2.5-flash"
+        llm_model: str = "gemini-2.5-flash",
+        max_concurrency: int = 8
     ):
         """Initialize the GAIA evaluator.
         
@@ -161,6 +176,7 @@ class GAIAEvaluator:
             task_timeout: Timeout for each task in seconds
             use_llm_scoring: Whether to use LLM-powered intelligent scoring
             llm_model: LLM model to use for scoring (if enabled)
+            max_concurrency: Maximum number of questions in flight to the purple agent
         """
         self.data_dir = pathlib.Path(data_dir)
         self.results_dir = pathlib.Path(results_dir)
@@ -172,6 +188,7 @@ class GAIAEvaluator:
         self.purple_agent_url = purple_agent_url
         self.use_llm_scoring = use_llm_scoring
         self.llm_model = llm_model
+        self.max_concurrency = max(1, max_concurrency)
         
         # Initialize httpx client and A2A client (will be set up async)
         self.httpx_client: Optional[httpx.AsyncClient] = None
@@ -188,6 +205,7 @@ class GAIAEvaluator:
         logger.info(f"   🌐 Purple agent (test taker): {purple_agent_url}")
         logger.info(f"   💾 Results: {self.results_dir}")
         logger.info(f"   ⏱️  Timeout: {task_timeout}s per task")
+        logger.info(f"   🔀 Concurrency: {self.max_concurrency} questions in flight")
         if use_llm_scoring:
             logger.info(f"   🧠 LLM mode: {Colors.GREEN}ON{Colors.RESET} ({Colors.CYAN}{llm_model}{Colors.RESET})")
         else:
@@ -207,7 +225,13 @@ class GAIAEvaluator:
             base_url=self.purple_agent_url,
         )
         
-        agent_card = await resolver.get_agent_card()
+        try:
+            agent_card = await resolver.get_agent_card()
+        except Exception:
+            # Don't leak the connection pool of a client that never got used
+            await self.httpx_client.aclose()
+            self.httpx_client = None
+            raise
         logger.info(f"✓ Connected to: {Colors.CYAN}{agent_card.name}{Colors.RESET}")
         
         # Create A2A client using ClientFactory
@@ -218,11 +242,12 @@ class GAIAEvaluator:
         factory = ClientFactory(config)
         self.a2a_client = factory.create(agent_card)
     
-    async def _send_question(self, question_text: str) -> str:
+    async def _send_question(self, question_text: str, question_id: str = "") -> str:
         """Send a question to the purple agent via A2A.
         
         Args:
             question_text: The question to send
+            question_id: Question ID used in progress logging
             
         Returns:
             The agent's response text
@@ -273,9 +298,93 @@ class GAIAEvaluator:
         
         if not response_text:
             logger.warning("⚠️  Empty response from purple agent")
+        else:
+            logger.info("   📥 Answer received (ID: %s, %d chars)", question_id, len(response_text))
         
         return response_text.strip()
     
+    async def _send_questions(self, questions: List[GAIAQuestion]) -> List[str]:
+        """Send a batch of questions to the purple agent concurrently.
+        
+        Up to ``max_concurrency`` questions are in flight at once, so the
+        round-trip latency of the purple agent is overlapped across questions
+        instead of paid once per question.
+        
+        Args:
+            questions: Questions to send
+            
+        Returns:
+            The agent's response text for each question, in input order.
+            Failed requests yield an empty string.
+        """
+        if self.a2a_client is None:
+            try:
+                await self._setup_client()
+            except Exception as e:
+                # Every request would fail (and retry the setup) the same way
+                logger.error(f"❌ Purple agent error: {e}")
+                return [""] * len(questions)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def send(question: GAIAQuestion) -> str:
+            async with semaphore:
+                try:
+                    return await self._send_question(question.question, question.id)
+                except Exception as e:
+                    logger.error(f"❌ Purple agent error ({question.id}): {e}")
+                    return ""
+        
+        return list(await asyncio.gather(*(send(q) for q in questions)))
+    
+    async def _llm_evaluate_many(
+        self,
+        questions: List[GAIAQuestion],
+        answers: List[str],
+        scores: List[Tuple[float, bool, bool]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run LLM evaluation concurrently for answers deterministic scoring rejected.
+        
+        Only non-empty answers with a deterministic score of 0.0 are sent to the
+        LLM coordinator, with up to ``max_concurrency`` evaluations in flight.
+        
+        Args:
+            questions: Evaluated questions
+            answers: The purple agent's answer for each question
+            scores: Deterministic (score, exact_match, normalized_match) for each question
+            
+        Returns:
+            The LLM evaluation for each question, in input order, or None where
+            LLM scoring was not needed
+        """
+        pending = [
+            idx for idx, (answer, (score, _, _)) in enumerate(zip(answers, scores, strict=True))
+            if self.use_llm_scoring and score == 0.0 and answer
+        ]
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        if not pending:
+            return evaluations
+        
+        logger.info(
+            "🤖 %sInvoking LLM evaluation for %d answers%s (up to %d at a time)...",
+            Colors.MAGENTA, len(pending), Colors.RESET, self.max_concurrency
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def evaluate(idx: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._llm_evaluate(
+                    question=questions[idx].question,
+                    predicted_answer=answers[idx],
+                    gold_answer=questions[idx].gold_answer,
+                    deterministic_score=scores[idx][0]
+                )
+        
+        results = await asyncio.gather(*(evaluate(idx) for idx in pending))
+        for idx, evaluation in zip(pending, results, strict=True):
+            evaluations[idx] = evaluation
+        return evaluations
+    
     async def _llm_evaluate(
         self,
         question: str,
@@ -414,47 +523,48 @@ Use answer_analyzer to assess quality, semantic_scorer to check equivalence, and
         
         logger.info(f"📋 Loaded {Colors.CYAN}{len(questions)}{Colors.RESET} questions from {Colors.YELLOW}{filename}{Colors.RESET}")
         
-        # Evaluate each question using a2a-sdk
+        # Send all questions to the purple agent via a2a-sdk concurrently,
+        # then score them in the original (seeded) order
+        logger.info(f"📤 Sending questions to purple agent (up to {self.max_concurrency} at a time)...")
+        answers = await self._send_questions(questions)
+        
+        # Deterministic scoring is cheap; the LLM evaluations it leaves over
+        # are slow round trips, so run those concurrently as well
+        scores = [
+            self.scorer.score(predicted_answer, question.gold_answer)
+            for question, predicted_answer in zip(questions, answers, strict=True)
+        ]
+        llm_evals = await self._llm_evaluate_many(questions, answers, scores)
+        
         results = []
         logger.info("")
-        for idx, question in enumerate(questions):
-            logger.info(f"\n{'─'*70}")
-            logger.info(f"📝 {Colors.BOLD}Question {idx + 1}/{len(questions)}{Colors.RESET} (ID: {question.id})")
-            logger.info(f"   {question.question[:80]}{'...' if len(question.question) > 80 else ''}")
-            logger.info(f"   🎯 Gold answer: {Colors.YELLOW}{question.gold_answer}{Colors.RESET}")
+        for idx, (question, predicted_answer) in enumerate(zip(questions, answers, strict=True)):
+            # Lazy %-style arguments: nothing is formatted when INFO is disabled
+            logger.info("\n%s", RULE)
+            logger.info(
+                "📝 %sQuestion %d/%d%s (ID: %s)",
+                Colors.BOLD, idx + 1, len(questions), Colors.RESET, question.id
+            )
+            logger.info(
+                "   %s%s", question.question[:80], '...' if len(question.question) > 80 else ''
+            )
+            logger.info("   🎯 Gold answer: %s%s%s", Colors.YELLOW, question.gold_answer, Colors.RESET)
             
-            try:
-                predicted_answer = await self._send_question(question.question)
-                preview = predicted_answer[:60] if predicted_answer else 'empty'
-                logger.info(f"   💬 Response: {preview}{'...' if len(predicted_answer) > 60 else ''}")
-                
-            except Exception as e:
-                logger.error(f"❌ Purple agent error: {e}")
-                predicted_answer = ""
+            preview = predicted_answer[:60] if predicted_answer else 'empty'
+            logger.info("   💬 Response: %s%s", preview, '...' if len(predicted_answer) > 60 else '')
             
-            # Score the answer
-            score, exact_match, normalized_match = self.scorer.score(
-                predicted_answer, 
-                question.gold_answer
-            )
+            score, exact_match, normalized_match = scores[idx]
             
-            # Use LLM scoring if enabled and deterministic score is 0.0
-            llm_eval = None
+            # LLM scoring result, if enabled and the deterministic score was 0.0
+            llm_eval = llm_evals[idx]
             final_score = score
             
-            if self.use_llm_scoring and score == 0.0 and predicted_answer:
-                logger.info(f"   🤖 {Colors.MAGENTA}Invoking LLM evaluation...{Colors.RESET}")
-                llm_eval = await self._llm_evaluate(
-                    question=question.question,
-                    predicted_answer=predicted_answer,
-                    gold_answer=question.gold_answer,
-                    deterministic_score=score
-                )
+            if llm_eval is not None:
                 final_score = llm_eval["llm_score"]
                 conf_emoji = "🟢" if llm_eval['confidence'] == "high" else "🟡" if llm_eval['confidence'] == "medium" else "🔴"
                 logger.info(
-                    f"   {conf_emoji} LLM Score: {Colors.CYAN}{final_score}{Colors.RESET} "
-                    f"(confidence: {llm_eval['confidence']})"
+                    "   %s LLM Score: %s%s%s (confidence: %s)",
+                    conf_emoji, Colors.CYAN, final_score, Colors.RESET, llm_eval['confidence']
                 )
             
             # Create evaluation result
@@ -480,8 +590,9 @@ Use answer_analyzer to assess quality, semantic_scorer to check equivalence, and
             score_emoji = "✅" if final_score == 1.0 else "❌" if final_score == 0.0 else "⚠️"
             score_color = Colors.GREEN if final_score == 1.0 else Colors.RED if final_score == 0.0 else Colors.YELLOW
             logger.info(
-                f"   {score_emoji} {Colors.BOLD}Score: {score_color}{final_score:.2f}{Colors.RESET} "
-                f"(exact: {exact_match}, norm: {normalized_match})"
+                "   %s %sScore: %s%.2f%s (exact: %s, norm: %s)",
+                score_emoji, Colors.BOLD, score_color, final_score, Colors.RESET,
+                exact_match, normalized_match
             )
         
         # Compute summary statistics
@@ -511,7 +622,7 @@ Use answer_analyzer to assess quality, semantic_scorer to check equivalence, and
         )
         
         logger.info(f"\n\n{'='*70}")
-        logger.info(f"📊 {Colors.BOLD}{Colors.CYAN}EVALUATION SUMMARY{Colors.RESET}")
+        logger.info(f"📊 {BOLD_CYAN}EVALUATION SUMMARY{Colors.RESET}")
         logger.info(f"{'='*70}")
         logger.info(f"   Total Questions:      {Colors.BOLD}{total_questions}{Colors.RESET}")
         logger.info(f"   Average Score:        {Colors.BOLD}{Colors.GREEN}{average_score:.4f}{Colors.RESET}")
@@ -638,6 +749,12 @@ def run_evaluation_cli() -> None:
         default="gemini-2.5-flash",
         help="LLM model to use for scoring (default: gemini-2.5-flash)"
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of questions sent to the purple agent at once (default: 8)"
+    )
     
     args = parser.parse_args()
     
@@ -648,7 +765,8 @@ def run_evaluation_cli() -> None:
         numerical_tolerance=args.numerical_tolerance,
         task_timeout=args.task_timeout,
         use_llm_scoring=args.use_llm_scoring,
-        llm_model=args.llm_model
+        llm_model=args.llm_model,
+        max_concurrency=args.max_concurrency
     )
     
     try:
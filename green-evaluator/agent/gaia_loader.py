@@ -14,12 +14,72 @@
 
 """GAIA benchmark question loader."""
 
+import functools
 import json
 import pathlib
-from typing import List, Optional
+import sys
+from typing import Iterator, List, Optional, Tuple
 
 from .schemas import GAIAQuestion
 
+try:
+    # Optional streaming parser; keeps memory flat on large question dumps
+    import ijson
+except ImportError:
+    ijson = None
+
+# Accepted source keys for each required GAIAQuestion field, in order of preference
+_FIELD_ALIASES = (
+    ("id", "question_id"),
+    ("question", "query"),
+    ("gold_answer", "answer"),
+)
+
+# String metadata values shorter than this are interned (labels, not free text)
+_INTERN_MAX_LEN = 32
+
+KeyLayout = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_key_layout(keys: frozenset) -> KeyLayout:
+    """Resolve which source key holds the id, question and gold answer.
+    
+    Args:
+        keys: The set of keys present in a raw question dict
+        
+    Returns:
+        Tuple of (id_key, question_key, answer_key); None for absent fields
+    """
+    id_key, question_key, answer_key = (
+        next((key for key in aliases if key in keys), None)
+        for aliases in _FIELD_ALIASES
+    )
+    return id_key, question_key, answer_key
+
+
+def _intern_metadata(raw: dict) -> dict:
+    """Copy a metadata dict, interning its keys and short string values.
+    
+    Every question repeats the same metadata keys and a handful of labels
+    (e.g. "level1"), so interning lets all question dicts share one copy
+    of each string instead of holding a fresh one per question.
+    
+    Args:
+        raw: Raw metadata dictionary
+        
+    Returns:
+        Metadata dictionary with interned keys and short string values
+    """
+    return {
+        sys.intern(key): (
+            sys.intern(value)
+            if isinstance(value, str) and len(value) < _INTERN_MAX_LEN
+            else value
+        )
+        for key, value in raw.items()
+    }
+
 
 class GAIALoader:
     """Loads and normalizes GAIA benchmark questions from JSON files.
@@ -65,62 +125,150 @@ class GAIALoader:
             FileNotFoundError: If the specified file does not exist
             json.JSONDecodeError: If the file contains invalid JSON
         """
+        return list(self.load_questions_iter(filename, level))
+    
+    def load_questions_iter(
+        self,
+        filename: str = "validation_complete.json",
+        level: Optional[int] = None
+    ) -> Iterator[GAIAQuestion]:
+        """Lazily load questions from a JSON file.
+        
+        When ``ijson`` is installed the file is parsed incrementally, so memory
+        use is bounded by a single question rather than the whole file.
+        
+        Args:
+            filename: Name of the JSON file to load
+            level: Optional difficulty level filter (1, 2, or 3)
+            
+        Returns:
+            Iterator of GAIAQuestion objects
+            
+        Raises:
+            FileNotFoundError: If the specified file does not exist
+        """
         filepath = self.data_dir / filename
         if not filepath.exists():
             raise FileNotFoundError(f"Question file not found: {filepath}")
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        # Normalize the data structure
-        questions = []
-        if isinstance(data, list):
-            # Direct list of questions
-            questions_data = data
-        elif isinstance(data, dict) and "questions" in data:
-            # Wrapped in a "questions" key
-            questions_data = data["questions"]
-        else:
-            raise ValueError(f"Unexpected JSON structure in {filepath}")
-        
-        for item in questions_data:
-            question = self._normalize_question(item)
+        return self._iter_questions(filepath, level)
+    
+    def _iter_questions(
+        self,
+        filepath: pathlib.Path,
+        level: Optional[int]
+    ) -> Iterator[GAIAQuestion]:
+        """Normalize and filter the raw questions of a file one at a time."""
+        # Corpora use one schema throughout, so resolve the key layout once
+        # from the first row instead of probing alternate keys on every row
+        layout = None
+        for item in self._iter_raw_questions(filepath):
+            if layout is None:
+                resolved = _resolve_key_layout(frozenset(item))
+                # Only reuse a layout that found every field: a partial one never
+                # raises on later rows, so it would silently blank their fields
+                if None not in resolved:
+                    layout = resolved
+            question = self._normalize_question(item, layout)
             
             # Apply level filter if specified
             if level is not None:
                 if question.metadata.get("level") != level:
                     continue
             
-            questions.append(question)
+            yield question
+    
+    def _iter_raw_questions(self, filepath: pathlib.Path) -> Iterator[dict]:
+        """Yield raw question dicts from a list or {"questions": [...]} file.
         
-        return questions
+        Args:
+            filepath: Path of the JSON file
+            
+        Raises:
+            json.JSONDecodeError: If the file contains invalid JSON
+            ValueError: If the JSON structure is not one of the supported formats
+        """
+        if ijson is None:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            
+            if isinstance(data, list):
+                # Direct list of questions
+                yield from data
+            elif isinstance(data, dict) and "questions" in data:
+                # Wrapped in a "questions" key
+                yield from data["questions"]
+            else:
+                raise ValueError(f"Unexpected JSON structure in {filepath}")
+            return
+        
+        try:
+            with open(filepath, "rb") as f:
+                head = f.read(64).lstrip()
+                f.seek(0)
+                
+                if head.startswith(b"["):
+                    yield from ijson.items(f, "item", use_float=True)
+                    return
+                
+                if head.startswith(b"{"):
+                    found = False
+                    for item in ijson.items(f, "questions.item", use_float=True):
+                        found = True
+                        yield item
+                    if found:
+                        return
+                    
+                    # Nothing streamed: either an empty list or no "questions" key
+                    f.seek(0)
+                    if any(
+                        prefix == "" and event == "map_key" and value == "questions"
+                        for prefix, event, value in ijson.parse(f)
+                    ):
+                        return
+                else:
+                    # Neither a list nor an object: parse it through so empty or
+                    # non-JSON input raises ijson's IncompleteJSONError or
+                    # lexical JSONError, mapped below as on the json.load path
+                    f.seek(0)
+                    for _ in ijson.parse(f):
+                        pass
+                
+                raise ValueError(f"Unexpected JSON structure in {filepath}")
+        except ijson.JSONError as e:
+            # Surface the same exception type as the json.load path
+            raise json.JSONDecodeError(f"Invalid JSON in {filepath}: {e}", "", 0) from e
     
-    def _normalize_question(self, item: dict) -> GAIAQuestion:
+    def _normalize_question(self, item: dict, layout: Optional[KeyLayout] = None) -> GAIAQuestion:
         """Normalize a raw question dict into a GAIAQuestion object.
         
         Args:
             item: Raw question dictionary
+            layout: Key layout resolved from an earlier row of the same file.
+                This row's own layout is resolved if none is given or a key
+                of the given one is missing from the row.
             
         Returns:
             Normalized GAIAQuestion object
         """
+        if layout is None or any(key is not None and key not in item for key in layout):
+            layout = _resolve_key_layout(frozenset(item))
+        
         # Extract required fields
-        question_id = item.get("id", "")
-        question_text = item.get("question", "")
-        gold_answer = item.get("gold_answer", "")
+        question_id, question_text, gold_answer = (
+            item[key] if key is not None else "" for key in layout
+        )
         
         # Extract or merge metadata
         if "metadata" in item:
-            metadata = dict(item["metadata"])
+            metadata = _intern_metadata(item["metadata"])
         else:
-            metadata = {}
-            # Legacy format support
-            if "difficulty" in item:
-                metadata["difficulty"] = item["difficulty"]
-            if "topic" in item:
-                metadata["topic"] = item["topic"]
-            if "level" in item:
-                metadata["level"] = item["level"]
+            # Legacy flat format: every top-level field other than the id,
+            # question and answer is metadata, custom fields included (not only
+            # difficulty/topic/level), so nothing in the row is dropped
+            metadata = _intern_metadata(
+                {key: value for key, value in item.items() if key not in layout}
+            )
         
         return GAIAQuestion(
             id=question_id,
@@ -14,9 +14,74 @@
 
 """Deterministic scoring for GAIA evaluation."""
 
+import functools
 import re
 from typing import Tuple
 
+# Anything but word characters and whitespace, and runs of whitespace
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+# ASCII-only fast path for _normalize: one C-level pass that lowercases and
+# drops exactly the characters _PUNCT_RE would remove
+_ASCII_NORMALIZE = str.maketrans({
+    c: None if _PUNCT_RE.match(c) else c.lower()
+    for c in map(chr, range(128))
+})
+
+# Integers, decimals and scientific notation
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*(?:[eE][-+]?\d+)?')
+
+
+# Gold answers repeat across evaluation runs, so the per-string helpers are
+# memoized at module level (shared by every GAIAScorer instance)
+@functools.lru_cache(maxsize=8192)
+def _normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace (see GAIAScorer._normalize)."""
+    if text.isascii():
+        return ' '.join(text.translate(_ASCII_NORMALIZE).split())
+    
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove punctuation (keep alphanumeric and spaces)
+    text = _PUNCT_RE.sub('', text)
+    
+    # Normalize whitespace (multiple spaces to single space)
+    text = _WS_RE.sub(' ', text)
+    
+    # Strip leading/trailing whitespace
+    text = text.strip()
+    
+    return text
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_number(text: str) -> float | None:
+    """First numerical value in text, or None (see GAIAScorer._extract_number)."""
+    # Try to parse the entire string as a number
+    try:
+        return float(text.strip())
+    except ValueError:
+        pass
+    
+    # Try to find a number in the string; only the first one is used
+    match = _NUMBER_RE.search(text)
+    
+    if match:
+        try:
+            return float(match.group())
+        except ValueError:
+            pass
+    
+    return None
+
+
+def clear_cache() -> None:
+    """Drop the memoized normalization and number-extraction results."""
+    _normalize_text.cache_clear()
+    _parse_number.cache_clear()
+
 
 class GAIAScorer:
     """Deterministic scoring for GAIA benchmark answers."""
@@ -99,19 +164,7 @@ class GAIAScorer:
         Returns:
             Normalized text
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove punctuation (keep alphanumeric and spaces)
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        # Normalize whitespace (multiple spaces to single space)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+        return _normalize_text(text)
     
     def _numerical_match(self, predicted: str, gold: str) -> float:
         """Check if answers match numerically within tolerance.
@@ -152,25 +205,7 @@ class GAIAScorer:
         Returns:
             Extracted number as float, or None if no number found
         """
-        # Try to parse the entire string as a number
-        try:
-            return float(text.strip())
-        except ValueError:
-            pass
-        
-        # Try to find a number in the string
-        # Match integers, decimals, and scientific notation
-        number_pattern = r'-?\d+\.?\d*(?:[eE][-+]?\d+)?'
-        matches = re.findall(number_pattern, text)
-        
-        if matches:
-            try:
-                # Return the first number found
-                return float(matches[0])
-            except ValueError:
-                pass
-        
-        return None
+        return _parse_number(text)
     
     def batch_score(self, predictions: list[str], golds: list[str]) -> list[Tuple[float, bool, bool]]:
         """Score a batch of predictions.
@@ -191,4 +226,11 @@ class GAIAScorer:
                 f"{len(predictions)} != {len(golds)}"
             )
         
-        return [self.score(pred, gold) for pred, gold in zip(predictions, golds)]
+        # Exact matches are the common case; resolve them inline and only pay
+        # for the normalized/numerical checks on the remaining pairs
+        exact = (1.0, True, True)
+        score = self.score
+        return [
+            exact if pred == gold else score(pred, gold)
+            for pred, gold in zip(predictions, golds, strict=True)
+        ]
@@ -3,9 +3,29 @@
 Transform GAIA dataset from Hugging Face format to normalized JSON.
 """
 
+import contextlib
 import json
+import os
 import pathlib
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
+
+try:
+    # Optional streaming parser; keeps memory flat on large Hugging Face dumps
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional faster JSON codec; the stdlib json module is used without it.
+    # Its output differs from json.dumps in two ways: floats in exponent form
+    # are spelled differently (1e16 vs 1e+16, 1e-7 vs 1e-07), and NaN/Infinity
+    # are written as null instead of json's non-standard NaN/Infinity tokens.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of leading questions copied to sample_questions.json
+SAMPLE_SIZE = 10
 
 
 def normalize_question(row_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -41,63 +61,149 @@ def normalize_question(row_data: Dict[str, Any]) -> Dict[str, Any]:
     return question
 
 
+def iter_rows(input_file: pathlib.Path) -> Iterator[Dict[str, Any]]:
+    """Yield the "row" dicts of a Hugging Face dataset dump one at a time.
+    
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    if ijson is None:
+        if orjson is not None:
+            data = orjson.loads(input_file.read_bytes())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        for item in data.get("rows", []):
+            yield item.get("row", {})
+        return
+    
+    with open(input_file, 'rb') as f:
+        try:
+            for item in ijson.items(f, "rows.item", use_float=True):
+                yield item.get("row", {})
+        except ijson.JSONError as e:
+            # Match the json.JSONDecodeError (a ValueError) of the non-streaming path
+            raise ValueError(f"Invalid JSON in {input_file}: {e}") from e
+
+
+class QuestionWriter:
+    """Incrementally write a {"questions": [...]} file.
+    
+    Without orjson the output is byte-for-byte what
+    json.dump(..., indent=2, ensure_ascii=False) produces; with it, only the
+    float and NaN spellings noted at the orjson import differ. Either way the
+    whole question list is never held in memory. Questions are
+    written to a temporary file next to ``path``, which only replaces ``path``
+    once the writer is closed without error, so a failed run never leaves a
+    truncated (but valid-looking) output file behind.
+    """
+    
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.count = 0
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('{\n  "questions": [')
+    
+    def write(self, question: Dict[str, Any]):
+        body = None
+        if orjson is not None:
+            try:
+                body = orjson.dumps(question, option=orjson.OPT_INDENT_2).decode('utf-8')
+            except TypeError:
+                # orjson.JSONEncodeError (a TypeError), e.g. for integers wider
+                # than 64 bits; the stdlib encoder handles this record
+                pass
+        if body is None:
+            body = json.dumps(question, indent=2, ensure_ascii=False)
+        # Nest the question two levels deep, as json.dump would
+        body = body.replace('\n', '\n    ')
+        self._file.write(',\n    ' if self.count else '\n    ')
+        self._file.write(body)
+        self.count += 1
+    
+    def close(self):
+        """Finish the JSON document and move it into place."""
+        self._file.write('\n  ]\n}' if self.count else ']\n}')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+    
+    def discard(self):
+        """Drop the partial output, leaving any existing file at path untouched."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+    
+    def __enter__(self) -> "QuestionWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
 def transform_gaia_data(input_file: pathlib.Path, output_dir: pathlib.Path):
-    """Transform GAIA data and create multiple output files."""
+    """Transform GAIA data and create multiple output files.
     
-    print(f"Loading data from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Extract all questions
-    all_questions = []
-    rows = data.get("rows", [])
-    
-    for item in rows:
-        row_data = item.get("row", {})
-        if row_data:
-            question = normalize_question(row_data)
-            all_questions.append(question)
+    Rows are parsed, normalized and written to every output file in a single
+    pass, so neither the input nor the output is ever fully held in memory.
+    """
     
-    print(f"Processed {len(all_questions)} questions")
+    print(f"Loading data from {input_file}...")
     
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save complete dataset
-    all_file = output_dir / "validation_complete.json"
-    with open(all_file, 'w', encoding='utf-8') as f:
-        json.dump({"questions": all_questions}, f, indent=2, ensure_ascii=False)
-    print(f"✓ Saved {len(all_questions)} questions to {all_file}")
-    
-    # Split by difficulty level
-    for level_num in [1, 2, 3]:
-        level_questions = [
-            q for q in all_questions 
-            if q["metadata"].get("level") == level_num
-        ]
+    with contextlib.ExitStack() as stack:
+        all_writer = stack.enter_context(
+            QuestionWriter(output_dir / "validation_complete.json")
+        )
+        level_writers = {
+            level_num: stack.enter_context(
+                QuestionWriter(output_dir / f"validation_level{level_num}.json")
+            )
+            for level_num in [1, 2, 3]
+        }
+        # Small sample for testing (first SAMPLE_SIZE questions)
+        sample_writer = stack.enter_context(
+            QuestionWriter(output_dir / "sample_questions.json")
+        )
+        with_files = 0
         
-        level_file = output_dir / f"validation_level{level_num}.json"
-        with open(level_file, 'w', encoding='utf-8') as f:
-            json.dump({"questions": level_questions}, f, indent=2, ensure_ascii=False)
-        print(f"✓ Saved {len(level_questions)} level {level_num} questions to {level_file}")
-    
-    # Create a small sample for testing (first 10 questions)
-    sample_questions = all_questions[:10]
-    sample_file = output_dir / "sample_questions.json"
-    with open(sample_file, 'w', encoding='utf-8') as f:
-        json.dump({"questions": sample_questions}, f, indent=2, ensure_ascii=False)
-    print(f"✓ Saved {len(sample_questions)} sample questions to {sample_file}")
+        for row_data in iter_rows(input_file):
+            if not row_data:
+                continue
+            question = normalize_question(row_data)
+            
+            all_writer.write(question)
+            level_writer: Optional[QuestionWriter] = level_writers.get(
+                question["metadata"].get("level")
+            )
+            if level_writer is not None:
+                level_writer.write(question)
+            if sample_writer.count < SAMPLE_SIZE:
+                sample_writer.write(question)
+            if question["metadata"].get("file_name"):
+                with_files += 1
+    
+    print(f"Processed {all_writer.count} questions")
+    print(f"✓ Saved {all_writer.count} questions to {all_writer.path}")
+    for level_num, level_writer in level_writers.items():
+        print(
+            f"✓ Saved {level_writer.count} level {level_num} questions "
+            f"to {level_writer.path}"
+        )
+    print(f"✓ Saved {sample_writer.count} sample questions to {sample_writer.path}")
     
     # Print statistics
     print("\n=== Dataset Statistics ===")
-    print(f"Total questions: {len(all_questions)}")
-    print(f"Level 1: {len([q for q in all_questions if q['metadata'].get('level') == 1])}")
-    print(f"Level 2: {len([q for q in all_questions if q['metadata'].get('level') == 2])}")
-    print(f"Level 3: {len([q for q in all_questions if q['metadata'].get('level') == 3])}")
+    print(f"Total questions: {all_writer.count}")
+    for level_num, level_writer in level_writers.items():
+        print(f"Level {level_num}: {level_writer.count}")
     
     # Questions with file attachments
-    with_files = [q for q in all_questions if q["metadata"].get("file_name")]
-    print(f"Questions with file attachments: {len(with_files)}")
+    print(f"Questions with file attachments: {with_files}")
     
 
 if __name__ == "__main__":
@@ -14,36 +14,57 @@
 
 """End-to-end integration tests for the GAIA evaluator."""
 
+import multiprocessing
 import pytest
+import requests
 import time
-import threading
 from purple_baseline.a2a_mock_server import app
 from agent.evaluator import GAIAEvaluator
 
+SERVER_URL = "http://localhost:8080"
+SERVER_START_TIMEOUT = 10.0
+SERVER_POLL_INTERVAL = 0.05
 
-@pytest.fixture(scope="module")
+
+def _run_server():
+    """Serve the mock purple agent (module-level so it can be spawned)."""
+    # threaded=True so concurrent evaluator requests are not serialized
+    app.run(host="localhost", port=8080, debug=False, use_reloader=False, threaded=True)
+
+
+@pytest.fixture(scope="session")
 def mock_server():
-    """Start the mock purple agent server in a background thread."""
-    def run_server():
-        app.run(host="localhost", port=8080, debug=False, use_reloader=False)
-    
-    # Start server in background thread
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    
-    # Wait for server to start
-    time.sleep(2)
+    """Start the mock purple agent server once for the whole test session."""
+    # A separate process keeps the server off the test process's GIL
+    server_process = multiprocessing.Process(target=_run_server, daemon=True)
+    server_process.start()
     
-    yield
-    
-    # Server will be automatically stopped when process exits
+    try:
+        # Poll the health endpoint instead of sleeping a fixed amount
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while True:
+            try:
+                if requests.get(f"{SERVER_URL}/health", timeout=SERVER_POLL_INTERVAL).ok:
+                    break
+            except requests.exceptions.RequestException:
+                pass
+            if not server_process.is_alive():
+                pytest.fail(f"Mock server exited with code {server_process.exitcode}")
+            if time.monotonic() > deadline:
+                pytest.fail(f"Mock server did not start within {SERVER_START_TIMEOUT}s")
+            time.sleep(SERVER_POLL_INTERVAL)
+        
+        yield
+    finally:
+        server_process.terminate()
+        server_process.join(timeout=5)
 
 
 def test_end_to_end_evaluation(mock_server):
     """Test full end-to-end evaluation flow."""
     evaluator = GAIAEvaluator(
         data_dir="data/gaia",
-        purple_agent_url="http://localhost:8080",
+        purple_agent_url=SERVER_URL,
         results_dir="results/test"
     )
     
@@ -75,7 +96,7 @@ def test_health_check(mock_server):
     """Test purple agent health check."""
     evaluator = GAIAEvaluator(
         data_dir="data/gaia",
-        purple_agent_url="http://localhost:8080"
+        purple_agent_url=SERVER_URL
     )
     
     try:
@@ -89,12 +110,12 @@ def test_evaluation_reproducibility(mock_server):
     """Test that evaluation produces reproducible results."""
     evaluator1 = GAIAEvaluator(
         data_dir="data/gaia",
-        purple_agent_url="http://localhost:8080"
+        purple_agent_url=SERVER_URL
     )
     
     evaluator2 = GAIAEvaluator(
         data_dir="data/gaia",
-        purple_agent_url="http://localhost:8080"
+        purple_agent_url=SERVER_URL
     )
     
     try:
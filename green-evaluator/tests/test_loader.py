@@ -17,7 +17,9 @@
 import json
 import pathlib
 import pytest
+import sys
 import tempfile
+from agent import gaia_loader
 from agent.gaia_loader import GAIALoader
 from agent.schemas import GAIAQuestion
 
@@ -86,6 +88,51 @@ class TestGAIALoader:
         assert len(questions) == 1
         assert questions[0].id == "q1"
     
+    def test_load_questions_iter_is_lazy(self):
+        """Test that load_questions_iter yields questions one at a time."""
+        data = {
+            "questions": [
+                {"id": f"q{i}", "question": f"Question {i}?", "gold_answer": f"Answer {i}"}
+                for i in range(3)
+            ]
+        }
+        
+        temp_dir = self.create_temp_questions_file(data, "test.json")
+        loader = GAIALoader(temp_dir)
+        questions = loader.load_questions_iter("test.json")
+        
+        assert not isinstance(questions, list)
+        assert next(questions).id == "q0"
+        assert [q.id for q in questions] == ["q1", "q2"]
+    
+    def test_load_questions_unexpected_structure(self):
+        """Test loading a dict without a 'questions' key."""
+        temp_dir = self.create_temp_questions_file({"rows": []}, "test.json")
+        loader = GAIALoader(temp_dir)
+        
+        with pytest.raises(ValueError):
+            loader.load_questions("test.json")
+    
+    @pytest.mark.parametrize("content", [
+        '{"questions": [{"id": "q1", "question": "Q?", "gold_answer": "A"}, {"id": ',
+        "",
+        "  \n",
+        "not json",
+    ], ids=["truncated", "empty", "whitespace", "not-json"])
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_load_questions_malformed_json(self, monkeypatch, streaming, content):
+        """Test that malformed JSON raises JSONDecodeError with and without ijson."""
+        if streaming:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(gaia_loader, "ijson", None)
+        temp_dir = pathlib.Path(tempfile.mkdtemp())
+        (temp_dir / "test.json").write_text(content, encoding="utf-8")
+        loader = GAIALoader(temp_dir)
+        
+        with pytest.raises(json.JSONDecodeError):
+            loader.load_questions("test.json")
+    
     def test_load_questions_file_not_found(self):
         """Test loading from nonexistent file."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -114,6 +161,35 @@ class TestGAIALoader:
         assert questions[0].question == "What is this?"
         assert questions[0].gold_answer == "This is a test"
     
+    def test_normalize_question_mixed_key_layouts(self):
+        """Test that rows whose keys differ from the first row still normalize."""
+        data = [
+            {"id": "q1", "question": "First?", "gold_answer": "A1"},
+            {"question_id": "q2", "query": "Second?", "answer": "A2"},
+        ]
+        
+        temp_dir = self.create_temp_questions_file(data, "test.json")
+        loader = GAIALoader(temp_dir)
+        questions = loader.load_questions("test.json")
+        
+        assert [q.id for q in questions] == ["q1", "q2"]
+        assert questions[1].question == "Second?"
+        assert questions[1].gold_answer == "A2"
+    
+    def test_normalize_question_first_row_missing_field(self):
+        """Test that a field absent from the first row is still read from later rows."""
+        data = [
+            {"question": "First?", "gold_answer": "A1"},
+            {"id": "q2", "question": "Second?", "gold_answer": "A2"},
+        ]
+        
+        temp_dir = self.create_temp_questions_file(data, "test.json")
+        loader = GAIALoader(temp_dir)
+        questions = loader.load_questions("test.json")
+        
+        assert [q.id for q in questions] == ["", "q2"]
+        assert "id" not in questions[1].metadata
+    
     def test_normalize_question_metadata_extraction(self):
         """Test that extra fields are added to metadata."""
         data = [
@@ -137,6 +213,26 @@ class TestGAIALoader:
         assert questions[0].metadata["level"] == 3
         assert questions[0].metadata["custom_field"] == "custom_value"
     
+    def test_metadata_strings_interned(self):
+        """Test that metadata keys and short labels are shared across questions."""
+        data = [
+            {"id": "q1", "question": "A?", "gold_answer": "A", "difficulty": "hard", "topic": "science"},
+            {"id": "q2", "question": "B?", "gold_answer": "B", "difficulty": "hard", "topic": "x" * 40},
+            {"id": "q3", "question": "C?", "gold_answer": "C", "metadata": {"difficulty": "hard"}},
+        ]
+        
+        temp_dir = self.create_temp_questions_file(data, "test.json")
+        loader = GAIALoader(temp_dir)
+        q1, q2, q3 = loader.load_questions("test.json")
+        
+        for question in (q1, q2, q3):
+            for key in question.metadata:
+                assert key is sys.intern(key)
+            assert question.metadata["difficulty"] is sys.intern("hard")
+        assert q1.metadata["topic"] is sys.intern("science")
+        # Long values are free text and stay as parsed
+        assert q2.metadata["topic"] is not sys.intern("x" * 40)
+    
     def test_get_questions_by_difficulty(self):
         """Test filtering questions by difficulty."""
         data = [
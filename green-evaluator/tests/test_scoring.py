@@ -15,134 +15,152 @@
 """Tests for the GAIA scoring module."""
 
 import pytest
-from agent.scoring import GAIAScorer
+from agent.scoring import GAIAScorer, _normalize_text, clear_cache
+
+
+@pytest.fixture(scope="class")
+def scorer():
+    """Scorer shared by every test in a class (it holds no per-test state)."""
+    return GAIAScorer(numerical_tolerance=0.01)
 
 
 class TestGAIAScorer:
     """Test suite for GAIAScorer."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.scorer = GAIAScorer(numerical_tolerance=0.01)
-    
-    def test_exact_match(self):
+    def test_exact_match(self, scorer):
         """Test exact string matching."""
-        score, exact, normalized = self.scorer.score("Paris", "Paris")
+        score, exact, normalized = scorer.score("Paris", "Paris")
         assert score == 1.0
         assert exact is True
         assert normalized is True
     
-    def test_exact_match_case_sensitive(self):
+    def test_exact_match_case_sensitive(self, scorer):
         """Test that exact match is case-sensitive."""
-        score, exact, normalized = self.scorer.score("Paris", "paris")
+        score, exact, normalized = scorer.score("Paris", "paris")
         assert score == 1.0
         assert exact is False
         assert normalized is True  # Normalized match succeeds
     
-    def test_normalized_match(self):
+    def test_normalized_match(self, scorer):
         """Test normalized string matching."""
-        score, exact, normalized = self.scorer.score("Paris", "paris")
+        score, exact, normalized = scorer.score("Paris", "paris")
         assert score == 1.0
         assert exact is False
         assert normalized is True
     
-    def test_normalized_match_with_punctuation(self):
+    def test_normalized_match_with_punctuation(self, scorer):
         """Test normalized matching with punctuation."""
-        score, exact, normalized = self.scorer.score("Hello, World!", "hello world")
+        score, exact, normalized = scorer.score("Hello, World!", "hello world")
         assert score == 1.0
         assert exact is False
         assert normalized is True
     
-    def test_normalized_match_with_whitespace(self):
+    def test_normalized_match_with_whitespace(self, scorer):
         """Test normalized matching with extra whitespace."""
-        score, exact, normalized = self.scorer.score("  New  York  ", "new york")
+        score, exact, normalized = scorer.score("  New  York  ", "new york")
         assert score == 1.0
         assert exact is False
         assert normalized is True
     
-    def test_numerical_match_exact(self):
+    def test_numerical_match_exact(self, scorer):
         """Test numerical matching with exact values."""
-        score, exact, normalized = self.scorer.score("42", "42")
+        score, exact, normalized = scorer.score("42", "42")
         assert score == 1.0
         assert exact is True
         assert normalized is True
     
-    def test_numerical_match_within_tolerance(self):
+    def test_numerical_match_within_tolerance(self, scorer):
         """Test numerical matching within tolerance."""
-        score, exact, normalized = self.scorer.score("100", "100.5")
+        score, exact, normalized = scorer.score("100", "100.5")
         # 0.5% difference, within 1% tolerance
         assert score == 1.0
         assert exact is False
         assert normalized is False
     
-    def test_numerical_match_outside_tolerance(self):
+    def test_numerical_match_outside_tolerance(self, scorer):
         """Test numerical matching outside tolerance."""
-        score, exact, normalized = self.scorer.score("100", "150")
+        score, exact, normalized = scorer.score("100", "150")
         # 50% difference, outside 1% tolerance
         assert score == 0.0
         assert exact is False
         assert normalized is False
     
-    def test_numerical_match_with_text(self):
+    def test_numerical_match_with_text(self, scorer):
         """Test numerical extraction from text."""
-        score, exact, normalized = self.scorer.score("The answer is 42", "42")
+        score, exact, normalized = scorer.score("The answer is 42", "42")
         assert score == 1.0
         assert exact is False
         assert normalized is False
     
-    def test_numerical_match_decimal(self):
+    def test_numerical_match_decimal(self, scorer):
         """Test numerical matching with decimals."""
-        score, exact, normalized = self.scorer.score("3.14", "3.14")
+        score, exact, normalized = scorer.score("3.14", "3.14")
         assert score == 1.0
         assert exact is True
         assert normalized is True
     
-    def test_numerical_match_zero(self):
+    def test_numerical_match_zero(self, scorer):
         """Test numerical matching with zero."""
-        score, exact, normalized = self.scorer.score("0", "0")
+        score, exact, normalized = scorer.score("0", "0")
         assert score == 1.0
         assert exact is True
         assert normalized is True
     
-    def test_no_match(self):
+    def test_no_match(self, scorer):
         """Test when there's no match."""
-        score, exact, normalized = self.scorer.score("Paris", "London")
+        score, exact, normalized = scorer.score("Paris", "London")
         assert score == 0.0
         assert exact is False
         assert normalized is False
     
-    def test_batch_scoring(self):
+    def test_batch_scoring(self, scorer):
         """Test batch scoring."""
         predictions = ["Paris", "42", "London"]
         golds = ["Paris", "42", "Berlin"]
         
-        results = self.scorer.batch_score(predictions, golds)
+        results = scorer.batch_score(predictions, golds)
         
         assert len(results) == 3
         assert results[0] == (1.0, True, True)  # Exact match
         assert results[1] == (1.0, True, True)  # Exact match
         assert results[2] == (0.0, False, False)  # No match
     
-    def test_batch_scoring_length_mismatch(self):
+    def test_batch_scoring_length_mismatch(self, scorer):
         """Test batch scoring with mismatched lengths."""
         predictions = ["Paris", "42"]
         golds = ["Paris"]
         
         with pytest.raises(ValueError):
-            self.scorer.batch_score(predictions, golds)
+            scorer.batch_score(predictions, golds)
     
-    def test_normalize_helper(self):
+    def test_normalize_helper(self, scorer):
         """Test the normalize helper method."""
-        assert self.scorer._normalize("Hello, World!") == "hello world"
-        assert self.scorer._normalize("  Multiple   Spaces  ") == "multiple spaces"
-        assert self.scorer._normalize("UPPERCASE") == "uppercase"
-        assert self.scorer._normalize("123-456-789") == "123456789"
-    
-    def test_extract_number_helper(self):
+        assert scorer._normalize("Hello, World!") == "hello world"
+        assert scorer._normalize("  Multiple   Spaces  ") == "multiple spaces"
+        assert scorer._normalize("UPPERCASE") == "uppercase"
+        assert scorer._normalize("123-456-789") == "123456789"
+    
+    def test_normalize_non_ascii(self, scorer):
+        """Test that ASCII and non-ASCII text normalize the same way."""
+        assert scorer._normalize("Café, Ölfen!") == "café ölfen"
+        assert scorer._normalize("snake_case\ttab") == "snake_case tab"
+        assert scorer._normalize("a\u00a0 b") == "a b"
+    
+    def test_extract_number_helper(self, scorer):
         """Test the extract_number helper method."""
-        assert self.scorer._extract_number("42") == 42.0
-        assert self.scorer._extract_number("3.14") == 3.14
-        assert self.scorer._extract_number("The answer is 42") == 42.0
-        assert self.scorer._extract_number("-17") == -17.0
-        assert self.scorer._extract_number("1.5e3") == 1500.0
-        assert self.scorer._extract_number("No number here") is None
+        assert scorer._extract_number("42") == 42.0
+        assert scorer._extract_number("3.14") == 3.14
+        assert scorer._extract_number("The answer is 42") == 42.0
+        assert scorer._extract_number("-17") == -17.0
+        assert scorer._extract_number("1.5e3") == 1500.0
+        assert scorer._extract_number("No number here") is None
+    
+    def test_clear_cache(self, scorer):
+        """Test that the memoized helpers can be reset."""
+        assert scorer._normalize("Hello, World!") == "hello world"
+        assert _normalize_text.cache_info().currsize > 0
+        
+        clear_cache()
+        
+        assert _normalize_text.cache_info().currsize == 0
+        assert scorer._normalize("Hello, World!") == "hello world"
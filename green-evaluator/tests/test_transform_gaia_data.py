@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the GAIA dataset transform script."""
+
+import importlib.util
+import json
+import pathlib
+import pytest
+
+_SCRIPT = pathlib.Path(__file__).resolve().parent.parent / "scripts" / "transform_gaia_data.py"
+_spec = importlib.util.spec_from_file_location("transform_gaia_data", _SCRIPT)
+transform_gaia_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(transform_gaia_data)
+
+
+def _rows(count: int) -> dict:
+    """Build a Hugging Face style dump with count level-1 questions."""
+    return {
+        "rows": [
+            {"row": {"task_id": f"t{i}", "Question": f"Q{i}?", "Level": "1", "Final answer": f"A{i}"}}
+            for i in range(count)
+        ]
+    }
+
+
+class TestTransformGaiaData:
+    """Test suite for transform_gaia_data."""
+    
+    def test_transform_writes_all_outputs(self, tmp_path):
+        """Test that every output file is written and matches json.dump."""
+        input_file = tmp_path / "gaia.json"
+        input_file.write_text(json.dumps(_rows(3)), encoding="utf-8")
+        output_dir = tmp_path / "out"
+        
+        transform_gaia_data.transform_gaia_data(input_file, output_dir)
+        
+        complete = json.loads((output_dir / "validation_complete.json").read_text(encoding="utf-8"))
+        assert [q["id"] for q in complete["questions"]] == ["t0", "t1", "t2"]
+        assert (output_dir / "validation_complete.json").read_text(encoding="utf-8") == json.dumps(
+            complete, indent=2, ensure_ascii=False
+        )
+        level2 = json.loads((output_dir / "validation_level2.json").read_text(encoding="utf-8"))
+        assert level2 == {"questions": []}
+    
+    def test_writer_falls_back_for_values_orjson_rejects(self, tmp_path):
+        """Test that a record orjson cannot encode is written with the stdlib encoder."""
+        path = tmp_path / "questions.json"
+        questions = [{"id": "q0", "value": 1}, {"id": "q1", "value": 2 ** 70}]
+        
+        with transform_gaia_data.QuestionWriter(path) as writer:
+            for question in questions:
+                writer.write(question)
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == {"questions": questions}
+    
+    def test_transform_failure_keeps_previous_outputs(self, tmp_path):
+        """Test that a malformed input leaves earlier outputs intact and no partial files."""
+        input_file = tmp_path / "gaia.json"
+        input_file.write_text(json.dumps(_rows(5)), encoding="utf-8")
+        output_dir = tmp_path / "out"
+        transform_gaia_data.transform_gaia_data(input_file, output_dir)
+        before = {p.name: p.read_bytes() for p in output_dir.iterdir()}
+        
+        # Cut the dump off partway through the third row
+        text = json.dumps(_rows(5))
+        input_file.write_text(text[:text.index('"t3"')], encoding="utf-8")
+        with pytest.raises(ValueError):
+            transform_gaia_data.transform_gaia_data(input_file, output_dir)
+        
+        after = {p.name: p.read_bytes() for p in output_dir.iterdir()}
+        assert after == before
@@ -23,14 +23,8 @@ The architecture follows the DeepResearchAgent pattern with a coordinator
 that orchestrates specialized sub-agents.
 """
 
-import os
-from pathlib import Path
-from dotenv import load_dotenv
-
 # Load environment variables from .env file in parent directory
-env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+from . import _env  # noqa: F401
 
 from . import agent
 from .agent import root_agent, gaia_coordinator
@@ -0,0 +1,17 @@
+"""Load the package's .env file once per process tree.
+
+Modules that need environment configuration import this module instead of
+calling load_dotenv() themselves, so the file is parsed only on first import.
+"""
+
+import os
+from pathlib import Path
+
+from dotenv import find_dotenv, load_dotenv
+
+ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# Forked workers inherit the parent's environment, so skip re-parsing the file there
+if not os.getenv("_PURPLE_ENV_LOADED"):
+    load_dotenv(ENV_PATH if ENV_PATH.is_file() else find_dotenv())
+    os.environ["_PURPLE_ENV_LOADED"] = "1"
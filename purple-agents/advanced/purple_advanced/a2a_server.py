@@ -2,37 +2,46 @@
 
 import logging
 import os
+import sys
 import warnings
-from dotenv import load_dotenv
 from google.adk.a2a.utils.agent_to_a2a import to_a2a
-from .agent import gaia_test_taker
 
 # Load environment variables
-load_dotenv()
+from . import _env  # noqa: F401
+from .agent import gaia_test_taker
+
+# Only emit ANSI colors when logging to a terminal (and NO_COLOR is unset)
+_USE_COLOR = sys.stderr.isatty() and os.getenv("NO_COLOR") is None
 
 # ANSI color codes for clean logging
 class Colors:
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    MAGENTA = '\033[95m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    RESET = '\033[0m' if _USE_COLOR else ''
+
+# Colored "[LEVEL]" prefixes, built once instead of per record
+_LEVEL_PREFIX = {
+    level: f"{color}[{level}]{Colors.RESET}"
+    for level, color in (
+        ('DEBUG', Colors.CYAN),
+        ('INFO', Colors.GREEN),
+        ('WARNING', Colors.YELLOW),
+        ('ERROR', Colors.RED),
+        ('CRITICAL', Colors.RED + Colors.BOLD),
+    )
+}
 
 # Custom formatter with colors and clean format
 class CleanFormatter(logging.Formatter):
     def format(self, record):
-        level_colors = {
-            'DEBUG': Colors.CYAN,
-            'INFO': Colors.GREEN,
-            'WARNING': Colors.YELLOW,
-            'ERROR': Colors.RED,
-            'CRITICAL': Colors.RED + Colors.BOLD
-        }
-        color = level_colors.get(record.levelname, Colors.RESET)
-        level_prefix = f"{color}[{record.levelname}]{Colors.RESET}"
+        level_prefix = _LEVEL_PREFIX.get(record.levelname)
+        if level_prefix is None:
+            level_prefix = f"{Colors.RESET}[{record.levelname}]{Colors.RESET}"
         return f"{level_prefix} {record.getMessage()}"
 
 # Setup clean logging for our module only
@@ -43,6 +52,21 @@ logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
+# LLM request labels per sub-agent, built once instead of per record
+_REQUEST_MAIN = f"{Colors.CYAN}🧠 Main agent thinking...{Colors.RESET}"
+_REQUEST_WEB_SEARCH = f"{Colors.MAGENTA}🔍 Web search agent...{Colors.RESET}"
+_REQUEST_DEEP_ANALYZER = f"{Colors.BLUE}🤔 Deep analyzer agent...{Colors.RESET}"
+_REQUEST_CALCULATOR = f"{Colors.YELLOW}🔢 Calculator agent...{Colors.RESET}"
+_REQUEST_OTHER = f"{Colors.CYAN}🤔 LLM processing...{Colors.RESET}"
+
+# Rewrites for the remaining ADK log lines as (substring, replacement) pairs,
+# checked in order; a None replacement drops the record
+_LLM_LOG_RULES = (
+    ('Response received', f"{Colors.GREEN}✓ Response ready{Colors.RESET}"),
+    ('Closing runner', f"{Colors.YELLOW}🔄 Resetting agent state{Colors.RESET}"),
+    ('Runner closed', None),  # Skip this redundant message
+)
+
 # Custom handler for Google ADK/LLM logs to make them beautiful
 class LLMFormatter(logging.Formatter):
     def format(self, record):
@@ -55,37 +79,47 @@ class LLMFormatter(logging.Formatter):
         # Clean up LLM request logs with sub-agent identification
         if 'Sending out request' in msg:
             if 'gemini-2.5-pro' in msg:
-                return f"{Colors.CYAN}🧠 Main agent thinking...{Colors.RESET}"
+                return _REQUEST_MAIN
             elif 'gemini-2.5-flash' in msg and 'lite' not in msg.lower():
-                return f"{Colors.MAGENTA}🔍 Web search agent...{Colors.RESET}"
+                return _REQUEST_WEB_SEARCH
             elif 'gemini-2.0-flash' in msg:
-                return f"{Colors.BLUE}🤔 Deep analyzer agent...{Colors.RESET}"
+                return _REQUEST_DEEP_ANALYZER
             elif 'flash-lite' in msg.lower():
-                return f"{Colors.YELLOW}🔢 Calculator agent...{Colors.RESET}"
+                return _REQUEST_CALCULATOR
             else:
-                return f"{Colors.CYAN}🤔 LLM processing...{Colors.RESET}"
-        
-        # Clean up response logs
-        elif 'Response received' in msg:
-            return f"{Colors.GREEN}✓ Response ready{Colors.RESET}"
-        
-        # Clean up runner logs
-        elif 'Closing runner' in msg:
-            return f"{Colors.YELLOW}🔄 Resetting agent state{Colors.RESET}"
-        elif 'Runner closed' in msg:
-            return None  # Skip this redundant message
+                return _REQUEST_OTHER
         
+        # Clean up response and runner logs
+        for needle, replacement in _LLM_LOG_RULES:
+            if needle in msg:
+                return replacement
         return msg
 
 class SkipNoneFilter(logging.Filter):
-    """Filter out None messages from LLM formatter."""
+    """Filter out None messages from LLM formatter.
+    
+    Surviving records keep the formatted line in ``record.llm_message`` so
+    the handler does not format them a second time.
+    """
+    def __init__(self):
+        super().__init__()
+        self._formatter = LLMFormatter()
+    
     def filter(self, record):
-        formatter = LLMFormatter()
-        return formatter.format(record) is not None
+        msg = self._formatter.format(record)
+        if msg is None:
+            return False
+        record.llm_message = msg
+        return True
+
+class PassthroughFormatter(logging.Formatter):
+    """Emit the line already produced by SkipNoneFilter."""
+    def format(self, record):
+        return record.llm_message
 
 # Setup clean logging for ADK libraries
 llm_handler = logging.StreamHandler()
-llm_handler.setFormatter(LLMFormatter())
+llm_handler.setFormatter(PassthroughFormatter())
 llm_handler.addFilter(SkipNoneFilter())
 
 # Apply to ADK and LLM loggers with custom formatter
@@ -151,12 +185,16 @@ def main():
     logger.info(f"{'='*70}")
     logger.info(f"   {Colors.YELLOW}Press CTRL+C to quit{Colors.RESET}\n")
     
-    # Run the A2A app with uvicorn
+    # Run the A2A app with uvicorn. uvloop/httptools are picked up automatically
+    # when installed (uvicorn[standard]); per-request access logging is off.
+    # The app object is passed directly so uvicorn does not import this module
+    # (and the whole ADK stack) a second time.
     uvicorn.run(
-        "purple_advanced.a2a_server:a2a_app",
+        a2a_app,
         host="0.0.0.0",
         port=PORT,
-        reload=False
+        reload=False,
+        access_log=False
     )
 
 
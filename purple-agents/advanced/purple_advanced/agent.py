@@ -11,8 +11,14 @@ DeepResearchAgent pattern with:
   - calculator_agent: Handles mathematical computations
 """
 
+import asyncio
+import os
+import weakref
+from typing import Any
+
 from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.tool_context import ToolContext
 
 from . import prompt
 from .sub_agents.web_search import web_search_agent
@@ -21,6 +27,35 @@ from .sub_agents.calculator import calculator_agent
 
 MODEL = "gemini-2.5-pro"
 
+# Upper bound on sub-agent calls in flight at once, so parallel delegation
+# does not run into Gemini rate limits (429s); at least 1, as 0 would deadlock
+MAX_CONCURRENCY = max(1, int(os.getenv("GEMINI_MAX_CONCURRENCY", "8")))
+
+# An asyncio.Semaphore binds to the loop it is first awaited on, and the
+# coordinator may run on several loops (e.g. one per worker thread), so each
+# running loop gets its own; entries go away with their loop
+_sub_agent_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _sub_agent_semaphore() -> asyncio.Semaphore:
+    """Return the sub-agent semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _sub_agent_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _sub_agent_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENCY)
+    return semaphore
+
+
+class BoundedAgentTool(AgentTool):
+    """AgentTool whose runs share a per-event-loop concurrency limit."""
+    
+    async def run_async(self, *, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        async with _sub_agent_semaphore():
+            return await super().run_async(args=args, tool_context=tool_context)
+
+
 gaia_test_taker = LlmAgent(
     name="gaia_test_taker",
     model=MODEL,
@@ -33,9 +68,9 @@ gaia_test_taker = LlmAgent(
     instruction=prompt.GAIA_COORDINATOR_PROMPT,
     output_key="final_answer",
     tools=[
-        AgentTool(agent=web_search_agent),
-        AgentTool(agent=deep_analyzer_agent),
-        AgentTool(agent=calculator_agent),
+        BoundedAgentTool(agent=web_search_agent),
+        BoundedAgentTool(agent=deep_analyzer_agent),
+        BoundedAgentTool(agent=calculator_agent),
     ],
 )
 
@@ -1,12 +1,11 @@
 """Calculator Agent for mathematical computations."""
 
 import os
-from dotenv import load_dotenv
 from google.adk.agents import LlmAgent
 
+from ... import _env  # noqa: F401
 from . import prompt
 
-load_dotenv()
 # Use Gemini 2.5 Flash-Lite for calculations (ultra-fast)
 MODEL = os.getenv("CALCULATOR_MODEL", "gemini-2.5-flash-lite")
 
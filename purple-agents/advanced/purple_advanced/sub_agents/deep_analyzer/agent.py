@@ -15,12 +15,11 @@
 """Deep Analyzer Agent for complex reasoning and multi-step problem solving."""
 
 import os
-from dotenv import load_dotenv
 from google.adk.agents import LlmAgent
 
+from ... import _env  # noqa: F401
 from . import prompt
 
-load_dotenv()
 # Use Gemini 1.5 Pro for deep analysis (strong reasoning)
 MODEL = os.getenv("DEEP_ANALYZER_MODEL", "gemini-1.5-pro")
 
@@ -15,10 +15,11 @@
 
 """Quick test script for the Purple Advanced Agent."""
 
+import asyncio
 import sys
 from purple_advanced import gaia_coordinator
 
-def main():
+async def main():
     """Test the agent with sample questions."""
     
     test_questions = [
@@ -42,24 +43,36 @@ def main():
     print("PURPLE ADVANCED AGENT - QUICK TEST")
     print("=" * 80)
     
-    for i, question in enumerate(test_questions, 1):
-        print(f"\n[{i}/{len(test_questions)}] Question: {question}")
-        print("-" * 80)
+    n = len(test_questions)
+    headers = [
+        f"\n[{i}/{n}] Question: {question}\n" + "-" * 80
+        for i, question in enumerate(test_questions, 1)
+    ]
+    
+    def ask(question):
+        return gaia_coordinator.run(question)
+    
+    # The questions are independent and I/O-bound, so run them concurrently
+    results = await asyncio.gather(
+        *(asyncio.to_thread(ask, question) for question in test_questions),
+        return_exceptions=True,
+    )
+    
+    for header, result in zip(headers, results, strict=True):
+        print(header)
         
-        try:
-            result = gaia_coordinator.run(question)
-            
-            if isinstance(result, dict):
-                answer = result.get("final_answer", str(result))
-            else:
-                answer = str(result)
-            
-            print(f"Answer: {answer}")
-            
-        except Exception as e:
-            print(f"Error: {e}")
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(result)
+            continue
+        
+        if isinstance(result, dict):
+            answer = result.get("final_answer", str(result))
+        else:
+            answer = str(result)
+        
+        print(f"Answer: {answer}")
     
     print("\n" + "=" * 80)
     print("Test completed!")
@@ -67,4 +80,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -16,6 +16,7 @@
 
 import logging
 import os
+import sys
 import warnings
 from dotenv import load_dotenv
 from google.adk.a2a.utils.agent_to_a2a import to_a2a
@@ -24,29 +25,38 @@ from .agent import baseline_agent
 # Load environment variables
 load_dotenv()
 
+# Only emit ANSI colors when logging to a terminal (and NO_COLOR is unset)
+_USE_COLOR = sys.stderr.isatty() and os.getenv("NO_COLOR") is None
+
 # ANSI color codes for clean logging
 class Colors:
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    MAGENTA = '\033[95m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    RESET = '\033[0m' if _USE_COLOR else ''
+
+# Colored "[LEVEL]" prefixes, built once instead of per record
+_LEVEL_PREFIX = {
+    level: f"{color}[{level}]{Colors.RESET}"
+    for level, color in (
+        ('DEBUG', Colors.CYAN),
+        ('INFO', Colors.GREEN),
+        ('WARNING', Colors.YELLOW),
+        ('ERROR', Colors.RED),
+        ('CRITICAL', Colors.RED + Colors.BOLD),
+    )
+}
 
 # Custom formatter with colors and clean format
 class CleanFormatter(logging.Formatter):
     def format(self, record):
-        level_colors = {
-            'DEBUG': Colors.CYAN,
-            'INFO': Colors.GREEN,
-            'WARNING': Colors.YELLOW,
-            'ERROR': Colors.RED,
-            'CRITICAL': Colors.RED + Colors.BOLD
-        }
-        color = level_colors.get(record.levelname, Colors.RESET)
-        level_prefix = f"{color}[{record.levelname}]{Colors.RESET}"
+        level_prefix = _LEVEL_PREFIX.get(record.levelname)
+        if level_prefix is None:
+            level_prefix = f"{Colors.RESET}[{record.levelname}]{Colors.RESET}"
         return f"{level_prefix} {record.getMessage()}"
 
 # Setup clean logging for our module only
@@ -57,40 +67,50 @@ logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
+# Rewrites for Google ADK/LLM log lines as (substring, replacement) pairs,
+# checked in order; a None replacement drops the record
+_LLM_LOG_RULES = (
+    ('App name mismatch', None),
+    ('Sending out request', f"{Colors.CYAN}🧠 Agent thinking...{Colors.RESET}"),
+    ('Response received', f"{Colors.GREEN}✓ Response ready{Colors.RESET}"),
+    ('Closing runner', f"{Colors.YELLOW}🔄 Resetting agent state{Colors.RESET}"),
+    ('Runner closed', None),  # Skip this redundant message
+)
+
 # Custom handler for Google ADK/LLM logs to make them beautiful
 class LLMFormatter(logging.Formatter):
     def format(self, record):
         msg = record.getMessage()
-        
-        # Filter out app name mismatch warnings completely
-        if 'App name mismatch' in msg:
-            return None
-        
-        # Clean up LLM request logs
-        if 'Sending out request' in msg:
-            return f"{Colors.CYAN}🧠 Agent thinking...{Colors.RESET}"
-        
-        # Clean up response logs
-        elif 'Response received' in msg:
-            return f"{Colors.GREEN}✓ Response ready{Colors.RESET}"
-        
-        # Clean up runner logs
-        elif 'Closing runner' in msg:
-            return f"{Colors.YELLOW}🔄 Resetting agent state{Colors.RESET}"
-        elif 'Runner closed' in msg:
-            return None  # Skip this redundant message
-        
+        for needle, replacement in _LLM_LOG_RULES:
+            if needle in msg:
+                return replacement
         return msg
 
 class SkipNoneFilter(logging.Filter):
-    """Filter out None messages from LLM formatter."""
+    """Filter out None messages from LLM formatter.
+    
+    Surviving records keep the formatted line in ``record.llm_message`` so
+    the handler does not format them a second time.
+    """
+    def __init__(self):
+        super().__init__()
+        self._formatter = LLMFormatter()
+    
     def filter(self, record):
-        formatter = LLMFormatter()
-        return formatter.format(record) is not None
+        msg = self._formatter.format(record)
+        if msg is None:
+            return False
+        record.llm_message = msg
+        return True
+
+class PassthroughFormatter(logging.Formatter):
+    """Emit the line already produced by SkipNoneFilter."""
+    def format(self, record):
+        return record.llm_message
 
 # Setup clean logging for ADK libraries
 llm_handler = logging.StreamHandler()
-llm_handler.setFormatter(LLMFormatter())
+llm_handler.setFormatter(PassthroughFormatter())
 llm_handler.addFilter(SkipNoneFilter())
 
 # Apply to ADK and LLM loggers with custom formatter
@@ -142,10 +162,14 @@ if __name__ == "__main__":
     logger.info(f"{'='*70}")
     logger.info(f"   {Colors.YELLOW}Press CTRL+C to quit{Colors.RESET}\n")
     
-    # Run the A2A app with uvicorn
+    # Run the A2A app with uvicorn. uvloop/httptools are picked up automatically
+    # when installed (uvicorn[standard]); per-request access logging is off.
+    # The app object is passed directly so uvicorn does not import this module
+    # (and the whole ADK stack) a second time.
     uvicorn.run(
-        "purple_baseline.a2a_server:a2a_app",
+        a2a_app,
         host="0.0.0.0",
         port=8080,
-        reload=False
+        reload=False,
+        access_log=False
     )
@@ -14,15 +14,29 @@
 
 """Purple Baseline Agent: GAIA benchmark question answering using ADK Agent."""
 
+import ast
+import asyncio
+import atexit
+import contextlib
+import functools
+import importlib.util
 import logging
+import operator
 import os
-from typing import Any, Dict, Optional
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import httpx
 from google.adk.agents import Agent
 from google.genai import types
 import google.genai as genai
 
 from . import prompt
+from .llm_cache import LLMCache, PersistentLLMCache
+from .semantic_cache import GeminiEmbedder, LocalEmbedder, SemanticCache
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +50,234 @@ MODEL = "gemini-2.0-flash-exp"
 MAX_OUTPUT_TOKENS = 2048
 TEMPERATURE = 0.1
 
+# Output token budget per GAIA level, capped at the agent's max_tokens.
+# Level 1 answers are a few tokens; harder levels may need room to think.
+_MAX_TOKENS_BY_LEVEL = {"1": 512, "2": 2048, "3": 8192}
+
+# In-process cache of LLM answers. Only used at low temperatures, where the
+# same prompt yields (near-)identical answers.
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+# Lifetime of answers persisted to LLM_CACHE_PATH, long enough to cover
+# evaluation reruns on later days. LLM_CACHE_TTL overrides it (0 = forever).
+PERSISTENT_CACHE_TTL = 7 * 24 * 3600
+
+# Gemini Batch API polling
+BATCH_POLL_INTERVAL = 30
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+# One GenAI client per API key, shared by every agent instance so they reuse
+# the same HTTP connection pool
+_CLIENTS: Dict[str, genai.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Connection pool sized for many concurrent requests, with connections kept
+# alive between bursts so they do not pay TCP/TLS setup again
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+
+
+def _http_options() -> types.HttpOptions:
+    """Connection pool settings for the GenAI client's httpx transports."""
+    client_args = {"limits": _HTTP_LIMITS}
+    # With aiohttp installed the SDK's async path uses it instead of httpx,
+    # and aiohttp does not accept httpx arguments
+    if importlib.util.find_spec("aiohttp") is not None:
+        return types.HttpOptions(client_args=client_args)
+    return types.HttpOptions(client_args=client_args, async_client_args=client_args)
+
+
+def _get_client(api_key: str) -> genai.Client:
+    """Return the shared GenAI client for an API key, creating it on first use."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(api_key)
+            if client is None:
+                client = _CLIENTS[api_key] = genai.Client(
+                    api_key=api_key,
+                    http_options=_http_options(),
+                )
+    return client
+
+@functools.lru_cache(maxsize=32)
+def _difficulty_context(difficulty: str, level: str) -> str:
+    """Return the per-question context line; there are only a few distinct ones."""
+    return f"Question difficulty: {difficulty} (Level {level})"
+
+@functools.lru_cache(maxsize=64)
+def _generation_config(temperature: float, max_tokens: int) -> types.GenerateContentConfig:
+    """Build (once per combination) the config for a generate_content request.
+    
+    Args:
+        temperature: Temperature for generation
+        max_tokens: Maximum tokens for output
+        
+    Returns:
+        A shared GenerateContentConfig; callers must not modify it
+    """
+    return types.GenerateContentConfig(
+        system_instruction=prompt.GAIA_AGENT_PROMPT,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+    )
+
+def _append_chunk(parts: List[str], text: Optional[str]) -> Optional[str]:
+    """Collect a streamed chunk; return the first line once it is complete."""
+    if not text:
+        return None
+    parts.append(text)
+    if "\n" in text:
+        answer = "".join(parts).lstrip()
+        if "\n" in answer:
+            return answer.split("\n", 1)[0]
+    return None
+
+# Boilerplate the model sometimes puts in front of the bare answer
+_PREFIX_RE = re.compile(r"^(?:(?:The answer is |Answer: |A: |Response: )\s*)+")
+
+# Fallback heuristic question classes, in priority order. Each alternative is
+# a zero-width lookahead anchored at the start of the question, so one match()
+# returns the first class that applies without lowercasing the question.
+_FALLBACK_RE = re.compile(
+    r"^(?:"
+    r"(?P<yesno>(?=.*?(?:is it|are there|does it|do they|can you|is )))"
+    r"|(?P<count>(?=how many))"
+    r"|(?P<year>(?=.*?(?:what year|when was)))"
+    r"|(?P<who>(?=who))"
+    r"|(?P<where>(?=where))"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+_NEGATION_RE = re.compile(r"not|never", re.IGNORECASE)
+_FALLBACK_ANSWERS = {
+    "count": "5",
+    "year": "2020",
+    "who": "Unknown",
+    "where": "United States",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _fallback_impl(question: str) -> str:
+    """Heuristic answer for a question, memoized since it depends only on the text.
+    
+    Args:
+        question: The question to answer
+        
+    Returns:
+        Heuristic answer
+    """
+    match = _FALLBACK_RE.match(question)
+    kind = match.lastgroup if match else None
+    
+    # Yes/No questions
+    if kind == "yesno":
+        return "No" if _NEGATION_RE.search(question) else "Yes"
+    
+    # Counting, year, who and where questions; default otherwise
+    return _FALLBACK_ANSWERS.get(kind, "I don't know")
+
+
+# Questions simple enough to answer locally without calling the LLM
+_ARITHMETIC_RE = re.compile(r"^\s*what is\s+([-+*/().\d\s]+?)\s*\??\s*$", re.IGNORECASE)
+_DATE_SPAN_RE = re.compile(
+    r"^\s*how many (days|hours) (?:are there )?between "
+    r"(\d{4}-\d{2}-\d{2}(?:[T ][\d:]+)?) and (\d{4}-\d{2}-\d{2}(?:[T ][\d:]+)?)\s*\??\s*$",
+    re.IGNORECASE,
+)
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+# Integers from here up can no longer all be represented exactly as floats
+_MAX_EXACT_MAGNITUDE = 2 ** 53
+
+
+def _eval_arithmetic(node: ast.AST) -> float:
+    """Evaluate a parsed +, -, *, / expression over numeric literals.
+    
+    Raises:
+        ValueError: If the expression contains anything else, or a literal or
+            intermediate result is too large for float arithmetic to be exact
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        value = _BINARY_OPS[type(node.op)](
+            _eval_arithmetic(node.left), _eval_arithmetic(node.right)
+        )
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        value = _UNARY_OPS[type(node.op)](_eval_arithmetic(node.operand))
+    else:
+        raise ValueError(f"Unsupported expression: {type(node).__name__}")
+    if abs(value) >= _MAX_EXACT_MAGNITUDE:
+        raise ValueError("Value too large to compute exactly")
+    return value
+
+
+def _format_number(value: float) -> str:
+    """Render a result the way a bare GAIA answer is written (4, not 4.0)."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value) if isinstance(value, int) else format(value, ".10g")
+
+
+def _try_direct(question: str) -> Optional[str]:
+    """Answer pure arithmetic and ISO date-span questions locally.
+    
+    Arithmetic is only answered when the result is a whole number below 2**53,
+    where float evaluation is exact; fractions and larger values, whose float
+    digits could be wrong, are left to the LLM.
+    
+    Args:
+        question: The question to answer
+        
+    Returns:
+        The answer, or None if the question needs the LLM
+    """
+    match = _ARITHMETIC_RE.match(question)
+    if match:
+        try:
+            tree = ast.parse(match.group(1), mode="eval").body
+        except (SyntaxError, RecursionError, MemoryError):
+            return None
+        # A bare number ("What is 42?") is not a computation
+        if isinstance(tree, ast.Constant):
+            return None
+        try:
+            value = _eval_arithmetic(tree)
+        except (ValueError, ZeroDivisionError, OverflowError, RecursionError):
+            return None
+        if not float(value).is_integer():
+            return None
+        return str(int(value))
+    
+    match = _DATE_SPAN_RE.match(question)
+    if match:
+        unit, start, end = match.groups()
+        try:
+            span = abs(datetime.fromisoformat(end) - datetime.fromisoformat(start))
+        except ValueError:
+            return None
+        if unit.lower() == "days":
+            return str(span.days)
+        return _format_number(span.total_seconds() / 3600)
+    
+    return None
+
 # Agent instructions
 BASELINE_AGENT_INSTRUCTION = """You are a helpful assistant answering questions from the GAIA benchmark.
 
@@ -81,7 +323,10 @@ class PurpleBaselineAgent:
         api_key: Optional[str] = None,
         model_name: str = MODEL,
         max_tokens: int = MAX_OUTPUT_TOKENS,
-        temperature: float = TEMPERATURE
+        temperature: float = TEMPERATURE,
+        enable_semantic_cache: Optional[bool] = None,
+        cache_path: Optional[str] = None,
+        prewarm_path: Optional[str] = None
     ):
         """Initialize the purple baseline agent.
         
@@ -90,6 +335,19 @@ class PurpleBaselineAgent:
             model_name: Gemini model to use
             max_tokens: Maximum tokens for output
             temperature: Temperature for generation
+            enable_semantic_cache: Serve paraphrased questions from earlier
+                answers. If None, reads the SEMANTIC_CACHE env var. Questions
+                are embedded with Gemini unless SEMANTIC_CACHE_BACKEND=local
+            cache_path: SQLite file that persists cached answers across
+                restarts. If None, reads the LLM_CACHE_PATH env var; unset
+                keeps the cache in memory only. Stored answers live for
+                LLM_CACHE_TTL seconds (default PERSISTENT_CACHE_TTL)
+            prewarm_path: Earlier Q/A log (JSON Lines or an evaluation summary)
+                to load into the semantic cache. If None, reads the
+                SEMANTIC_CACHE_PREWARM env var
+        
+        The persistent and semantic caches are only built when the first
+        question reaches the LLM, not here.
         """
         self.name = "purple_baseline_agent"
         self.model_name = model_name
@@ -103,14 +361,82 @@ class PurpleBaselineAgent:
             self.client = None
         else:
             try:
-                self.client = genai.Client(api_key=self.api_key)
+                self.client = _get_client(self.api_key)
                 logger.info(
-                    f"Initialized {self.name} with model {self.model_name} "
-                    f"(max_tokens={self.max_tokens}, temperature={self.temperature})"
+                    "Initialized %s with model %s (max_tokens=%s, temperature=%s)",
+                    self.name, self.model_name, self.max_tokens, self.temperature
                 )
             except Exception as e:
-                logger.error(f"Failed to initialize GenAI client: {e}")
+                logger.error("Failed to initialize GenAI client: %s", e)
                 self.client = None
+        
+        # Exact-match cache of answers to repeated questions. Its persistent
+        # backing and the semantic cache are built on first use by
+        # _ensure_caches, so importing this module (which creates root_agent)
+        # never opens SQLite, loads an embedding model or calls the network
+        self._cache = LLMCache(
+            max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+            ttl_seconds=RESPONSE_CACHE_TTL
+        )
+        self.semantic_cache: Optional[SemanticCache] = None
+        self._cache_path = cache_path
+        self._enable_semantic_cache = enable_semantic_cache
+        self._prewarm_path = prewarm_path
+        self._caches_ready = False
+        self._caches_lock = threading.Lock()
+        
+        # (event loop, cache key) -> task already generating that answer
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+    
+    def _ensure_caches(self) -> None:
+        """Build the persistent answer cache and the semantic cache on first use.
+        
+        Safe to call from several threads; only the first call does any work.
+        """
+        if self._caches_ready:
+            return
+        with self._caches_lock:
+            if self._caches_ready:
+                return
+            
+            # Persist answers so reruns of an evaluation skip answered questions
+            cache_path = self._cache_path or os.getenv("LLM_CACHE_PATH")
+            if cache_path:
+                try:
+                    ttl = float(os.getenv("LLM_CACHE_TTL", PERSISTENT_CACHE_TTL))
+                    self._cache.backing = PersistentLLMCache(
+                        cache_path, ttl_seconds=ttl or None
+                    )
+                except Exception as e:
+                    logger.warning("Persistent cache disabled: %s", e)
+            
+            enable_semantic_cache = self._enable_semantic_cache
+            if enable_semantic_cache is None:
+                enable_semantic_cache = os.getenv("SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+            if enable_semantic_cache and self.client:
+                try:
+                    if os.getenv("SEMANTIC_CACHE_BACKEND", "gemini") == "local":
+                        embedder = LocalEmbedder()
+                    else:
+                        embedder = GeminiEmbedder(self.client)
+                    persist_dir = os.getenv("SEMANTIC_CACHE_DIR")
+                    self.semantic_cache = SemanticCache(embedder, persist_dir=persist_dir)
+                    if persist_dir:
+                        atexit.register(self.semantic_cache.save)
+                except Exception as e:
+                    logger.warning("Semantic cache disabled: %s", e)
+            
+            prewarm_path = self._prewarm_path or os.getenv("SEMANTIC_CACHE_PREWARM")
+            if self.semantic_cache is not None and prewarm_path:
+                try:
+                    self.semantic_cache.prewarm(
+                        prewarm_path,
+                        bucket_of=lambda record: self._build_contents("", record.get("metadata"))[0]
+                    )
+                except Exception as e:
+                    logger.warning("Semantic cache prewarm failed: %s", e)
+            
+            self._caches_ready = True
     
     def answer_question(
         self,
@@ -126,20 +452,186 @@ class PurpleBaselineAgent:
         Returns:
             Answer string
         """
-        logger.info(f"Processing question: {question[:100]}...")
+        logger.info("Processing question: %.100s...", question)
+        
+        # Trivial computations never need the LLM
+        direct = _try_direct(question)
+        if direct is not None:
+            logger.info("Direct answer: %s", direct)
+            return direct
         
         # Try LLM first
         if self.client:
             try:
                 answer = self._answer_with_llm(question, metadata)
-                logger.info(f"LLM answer: {answer[:100]}...")
+                logger.info("LLM answer: %.100s...", answer)
                 return answer
             except Exception as e:
-                logger.error(f"LLM failed: {e}. Falling back to heuristics.")
+                logger.error("LLM failed: %s. Falling back to heuristics.", e)
         
         # Fallback to heuristics
         return self._fallback_answer(question)
     
+    async def aanswer_question(
+        self,
+        question: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Async version of answer_question using the native async Gemini client.
+        
+        Args:
+            question: The question to answer
+            metadata: Optional metadata about the question
+            
+        Returns:
+            Answer string
+        """
+        logger.info("Processing question: %.100s...", question)
+        
+        # Trivial computations never need the LLM
+        direct = _try_direct(question)
+        if direct is not None:
+            logger.info("Direct answer: %s", direct)
+            return direct
+        
+        # Try LLM first
+        if self.client:
+            try:
+                answer = await self._aanswer_with_llm(question, metadata)
+                logger.info("LLM answer: %.100s...", answer)
+                return answer
+            except Exception as e:
+                logger.error("LLM failed: %s. Falling back to heuristics.", e)
+        
+        # Fallback to heuristics
+        return self._fallback_answer(question)
+    
+    async def aanswer_many(
+        self,
+        items: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """Answer several questions concurrently.
+        
+        Args:
+            items: (question, metadata) pairs
+            max_concurrency: Maximum number of questions in flight at once
+            
+        Returns:
+            Answers in the same order as items
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def answer(question: str, metadata: Optional[Dict[str, Any]]) -> str:
+            async with semaphore:
+                return await self.aanswer_question(question, metadata)
+        
+        return await asyncio.gather(*(answer(q, m) for q, m in items))
+    
+    def answer_batch(
+        self,
+        items: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """Answer many questions through the Gemini Batch API.
+        
+        Batch jobs are billed at about half the interactive price but may take
+        minutes (up to a day) to finish, so use this for offline evaluation
+        runs and answer_question for latency-sensitive A2A traffic. Cached
+        answers are returned without being submitted.
+        
+        Args:
+            items: (question, metadata) pairs
+            poll_interval: Seconds between job status checks
+            timeout: Give up waiting after this many seconds (None waits
+                until the job finishes)
+            
+        Returns:
+            Answers in the same order as items. Questions the job could not
+            answer get the heuristic fallback answer
+        """
+        if not self.client:
+            return [self._fallback_answer(question) for question, _ in items]
+        self._ensure_caches()
+        
+        answers: List[Optional[str]] = [None] * len(items)
+        pending = []  # (index, question, context, cache key)
+        requests = []
+        for i, (question, metadata) in enumerate(items):
+            answers[i] = _try_direct(question)
+            if answers[i] is not None:
+                continue
+            context, contents = self._build_contents(question, metadata)
+            max_tokens = self._output_tokens(metadata)
+            cache_key, cached = self._lookup_cached(question, context, contents, max_tokens)
+            if cached is not None:
+                answers[i] = cached
+                continue
+            pending.append((i, question, context, cache_key))
+            requests.append({
+                "contents": [{"role": "user", "parts": [{"text": contents}]}],
+                "config": _generation_config(self.temperature, max_tokens),
+            })
+        
+        if requests:
+            responses = self._run_batch_job(requests, poll_interval, timeout)
+            # A failed or timed-out job returns fewer responses than requests;
+            # the unanswered tail is filled in below
+            for (i, question, context, cache_key), inlined in zip(pending, responses, strict=False):
+                response = getattr(inlined, "response", None)
+                if response is None:
+                    logger.error("Batch request failed: %s", getattr(inlined, "error", None))
+                    answers[i] = self._fallback_answer(question)
+                    continue
+                text = (response.text or "").lstrip().split("\n", 1)[0]
+                answers[i] = self._finish_answer(question, context, cache_key, text, response)
+        
+        # Anything the job did not return (failed or timed-out job)
+        return [
+            answer if answer is not None else self._fallback_answer(question)
+            for answer, (question, _) in zip(answers, items, strict=True)
+        ]
+    
+    def _run_batch_job(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float,
+        timeout: Optional[float]
+    ) -> List[Any]:
+        """Submit an inline batch job and wait for it to finish.
+        
+        Args:
+            requests: Inline GenerateContent requests
+            poll_interval: Seconds between job status checks
+            timeout: Maximum seconds to wait, or None
+            
+        Returns:
+            The inlined responses in request order, or an empty list if the job
+            did not succeed in time
+        """
+        job = self.client.batches.create(
+            model=self.model_name,
+            src=requests,
+            config={"display_name": f"{self.name}-{len(requests)}"},
+        )
+        logger.info("Submitted batch job %s with %d requests", job.name, len(requests))
+        
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while job.state.name not in _BATCH_DONE_STATES:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.error("Batch job %s still %s after %ss", job.name, job.state.name, timeout)
+                return []
+            time.sleep(poll_interval)
+            job = self.client.batches.get(name=job.name)
+        
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            logger.error("Batch job %s ended in %s: %s", job.name, job.state.name, job.error)
+            return []
+        
+        logger.info("Batch job %s succeeded", job.name)
+        return list(job.dest.inlined_responses or [])
+    
     def _answer_with_llm(
         self,
         question: str,
@@ -154,90 +646,320 @@ class PurpleBaselineAgent:
         Returns:
             LLM-generated answer
         """
-        # Build system prompt
-        system_prompt = prompt.GAIA_AGENT_PROMPT
-        
-        # Add metadata context if available
-        if metadata:
-            difficulty = metadata.get("difficulty", "unknown")
-            level = metadata.get("level", "unknown")
-            system_prompt += f"\n\nQuestion difficulty: {difficulty} (Level {level})"
+        self._ensure_caches()
+        context, contents = self._build_contents(question, metadata)
+        max_tokens = self._output_tokens(metadata)
+        cache_key, cached = self._lookup_cached(question, context, contents, max_tokens)
+        if cached is not None:
+            return cached
         
         try:
             # Generate response
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=question,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt,
-                    temperature=self.temperature,
-                    max_output_tokens=self.max_tokens,
-                )
+            text, response = self._generate_content(contents, max_tokens)
+            return self._finish_answer(question, context, cache_key, text, response)
+                
+        except Exception as e:
+            logger.error("Error calling LLM: %s: %s", type(e).__name__, e)
+            raise
+    
+    async def _aanswer_with_llm(
+        self,
+        question: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Async version of _answer_with_llm.
+        
+        Args:
+            question: The question to answer
+            metadata: Optional metadata
+            
+        Returns:
+            LLM-generated answer
+        """
+        if not self._caches_ready:
+            # First use may load an embedding model or prewarm; keep it off the loop
+            await asyncio.to_thread(self._ensure_caches)
+        context, contents = self._build_contents(question, metadata)
+        max_tokens = self._output_tokens(metadata)
+        
+        # The semantic cache makes blocking embedding calls; keep them off the loop
+        if self.semantic_cache is not None:
+            cache_key, cached = await asyncio.to_thread(
+                self._lookup_cached, question, context, contents, max_tokens
             )
+        else:
+            cache_key, cached = self._lookup_cached(question, context, contents, max_tokens)
+        if cached is not None:
+            return cached
+        if cache_key is None:
+            return await self._agenerate_answer(question, context, contents, max_tokens, cache_key)
+        
+        # Identical concurrent requests share one LLM call instead of each paying for it.
+        # No await separates the lookup from the insert, so the loop needs no lock.
+        inflight_key = (asyncio.get_running_loop(), cache_key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._agenerate_answer(question, context, contents, max_tokens, cache_key)
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        else:
+            logger.info("Joining in-flight request for an identical question")
+        # Shield so one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _agenerate_answer(
+        self,
+        question: str,
+        context: Optional[str],
+        contents: str,
+        max_tokens: int,
+        cache_key: Optional[str]
+    ) -> str:
+        """Call the LLM for a cache miss and post-process the answer.
+        
+        Args:
+            question: The question to answer
+            context: Difficulty/topic context for the question
+            contents: Request contents built by _build_contents
+            max_tokens: Output token budget
+            cache_key: Response cache key, or None if the answer is not cacheable
             
-            # Extract answer
-            if response and response.text:
-                answer = response.text.strip()
-                # Remove common prefixes that might slip through
-                for prefix in ["The answer is ", "Answer: ", "A: ", "Response: "]:
-                    if answer.startswith(prefix):
-                        answer = answer[len(prefix):].strip()
-                return answer
-            else:
-                # Log detailed response info for debugging
-                logger.warning(f"Empty response from LLM")
-                if hasattr(response, 'candidates') and response.candidates:
-                    candidate = response.candidates[0]
-                    logger.warning(f"Finish reason: {candidate.finish_reason}")
-                if hasattr(response, 'usage_metadata'):
-                    usage = response.usage_metadata
-                    logger.warning(
-                        f"Token usage - Prompt: {usage.prompt_token_count}, "
-                        f"Thoughts: {getattr(usage, 'thoughts_token_count', 0)}, "
-                        f"Total: {usage.total_token_count}"
-                    )
-                return "Unable to generate answer"
+        Returns:
+            LLM-generated answer
+        """
+        try:
+            # Generate response
+            text, response = await self._agenerate_content(contents, max_tokens)
+            
+            if self.semantic_cache is not None:
+                return await asyncio.to_thread(
+                    self._finish_answer, question, context, cache_key, text, response
+                )
+            return self._finish_answer(question, context, cache_key, text, response)
                 
         except Exception as e:
-            logger.error(f"Error calling LLM: {type(e).__name__}: {e}")
+            logger.error("Error calling LLM: %s: %s", type(e).__name__, e)
             raise
     
-    def _fallback_answer(self, question: str) -> str:
-        """Fallback heuristic answering when LLM is unavailable.
+    def _build_contents(
+        self,
+        question: str,
+        metadata: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], str]:
+        """Build the user turn for a question.
         
         Args:
             question: The question to answer
+            metadata: Optional metadata
             
         Returns:
-            Heuristic answer
+            The difficulty context line (None without metadata) and the full
+            user turn
         """
-        logger.info("Using fallback heuristic mode")
-        question_lower = question.lower()
+        # Build metadata context if available
+        context = None
+        if metadata:
+            context = _difficulty_context(
+                str(metadata.get("difficulty", "unknown")),
+                str(metadata.get("level", "unknown"))
+            )
+        
+        # Per-question context follows the static system prompt
+        contents = f"{context}\n\n{question}" if context else question
+        return context, contents
+    
+    def _output_tokens(self, metadata: Optional[Dict[str, Any]]) -> int:
+        """Pick the output token budget for a question from its GAIA level.
+        
+        Args:
+            metadata: Optional metadata
+            
+        Returns:
+            The level's budget capped at max_tokens, or max_tokens if the
+            level is unknown
+        """
+        if not metadata:
+            return self.max_tokens
+        budget = _MAX_TOKENS_BY_LEVEL.get(str(metadata.get("level")), self.max_tokens)
+        return min(budget, self.max_tokens)
+    
+    def _lookup_cached(
+        self,
+        question: str,
+        context: Optional[str],
+        contents: str,
+        max_tokens: int
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Look a question up in the exact-match and semantic caches.
+        
+        Args:
+            question: The question to answer
+            context: The difficulty context line, used as semantic cache bucket
+            contents: The full user turn
+            max_tokens: Output token budget of the request
+            
+        Returns:
+            The exact-match cache key (None if the temperature is too high to
+            cache) and the cached answer, or None on a miss
+        """
+        # Serve repeated questions from the response cache
+        cache_key = None
+        if self.temperature <= RESPONSE_CACHE_MAX_TEMPERATURE:
+            cache_key = LLMCache.cache_key(
+                m=self.model_name,
+                t=self.temperature,
+                n=max_tokens,
+                s=prompt.GAIA_AGENT_PROMPT,
+                c=contents,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cache_key, cached
+        
+        # Then paraphrases of earlier questions at the same difficulty
+        if self.semantic_cache is not None:
+            try:
+                cached = self.semantic_cache.lookup(question, bucket=context)
+            except Exception as e:
+                logger.warning("Semantic cache lookup failed: %s", e)
+                cached = None
+            if cached is not None:
+                logger.info("Semantic cache hit: %.100s...", cached)
+                if cache_key is not None:
+                    self._cache.set(cache_key, cached)
+                return cache_key, cached
+        
+        return cache_key, None
+    
+    def _finish_answer(
+        self,
+        question: str,
+        context: Optional[str],
+        cache_key: Optional[str],
+        text: str,
+        response: Any
+    ) -> str:
+        """Clean up the generated text and cache the resulting answer.
+        
+        Args:
+            question: The question that was answered
+            context: The difficulty context line, used as semantic cache bucket
+            cache_key: Exact-match cache key, or None to skip that cache
+            text: The generated text
+            response: The last response chunk, for diagnostics
+            
+        Returns:
+            The answer, or "Unable to generate answer" if the text is empty
+        """
+        # Extract answer
+        if text.strip():
+            # Remove common prefixes that might slip through
+            answer = _PREFIX_RE.sub("", text.strip(), count=1).rstrip()
+            if cache_key is not None:
+                self._cache.set(cache_key, answer)
+            if self.semantic_cache is not None:
+                try:
+                    self.semantic_cache.add(question, answer, bucket=context)
+                except Exception as e:
+                    logger.warning("Semantic cache insert failed: %s", e)
+            return answer
         
-        # Yes/No questions
-        if any(q in question_lower for q in ["is it", "are there", "does it", "do they", "can you", "is "]):
-            if "not" in question_lower or "never" in question_lower:
-                return "No"
-            return "Yes"
+        # Log detailed response info for debugging
+        logger.warning("Empty response from LLM")
+        if hasattr(response, 'candidates') and response.candidates:
+            candidate = response.candidates[0]
+            logger.warning("Finish reason: %s", candidate.finish_reason)
+        if hasattr(response, 'usage_metadata'):
+            usage = response.usage_metadata
+            logger.warning(
+                "Token usage - Prompt: %s, Thoughts: %s, Total: %s",
+                usage.prompt_token_count,
+                getattr(usage, "thoughts_token_count", 0),
+                usage.total_token_count
+            )
+        return "Unable to generate answer"
+    
+    def _generate_content(self, contents: str, max_tokens: int) -> Tuple[str, Any]:
+        """Stream the model's answer.
         
-        # Counting questions
-        if question_lower.startswith("how many"):
-            return "5"
+        The system prompt is always sent byte-for-byte identical and ahead of
+        anything question-specific, so consecutive requests share the longest
+        possible prefix for Gemini's implicit prompt caching. Per-question
+        context is part of the user turn instead.
         
-        # Year questions
-        if "what year" in question_lower or "when was" in question_lower:
-            return "2020"
+        Answers are expected on a single line, so the stream is abandoned as
+        soon as the first complete line has arrived instead of waiting for
+        the full completion.
+        
+        Args:
+            contents: The user turn (question plus any per-question context)
+            max_tokens: Maximum tokens for output
+            
+        Returns:
+            The answer text and the last response chunk received (for
+            finish reason and token usage), or None if nothing was received
+        """
+        config = _generation_config(self.temperature, max_tokens)
         
-        # Who questions
-        if question_lower.startswith("who"):
-            return "Unknown"
+        parts: List[str] = []
+        chunk = None
+        stream = self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=contents,
+            config=config,
+        )
+        # Closing the stream on early return releases the HTTP connection
+        with contextlib.closing(stream):
+            for chunk in stream:
+                line = _append_chunk(parts, chunk.text)
+                if line is not None:
+                    return line, chunk
         
-        # Where questions
-        if question_lower.startswith("where"):
-            return "United States"
+        return "".join(parts), chunk
+    
+    async def _agenerate_content(self, contents: str, max_tokens: int) -> Tuple[str, Any]:
+        """Async version of _generate_content.
         
-        # Default
-        return "I don't know"
+        Args:
+            contents: The user turn (question plus any per-question context)
+            max_tokens: Maximum tokens for output
+            
+        Returns:
+            The answer text and the last response chunk received, or None if
+            nothing was received
+        """
+        config = _generation_config(self.temperature, max_tokens)
+        
+        parts: List[str] = []
+        chunk = None
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=contents,
+            config=config,
+        )
+        # Breaking out of "async for" does not finalize an async generator,
+        # so close it explicitly to cancel the rest of the response
+        async with contextlib.aclosing(stream):
+            async for chunk in stream:
+                line = _append_chunk(parts, chunk.text)
+                if line is not None:
+                    return line, chunk
+        
+        return "".join(parts), chunk
+    
+    def _fallback_answer(self, question: str) -> str:
+        """Fallback heuristic answering when LLM is unavailable.
+        
+        Args:
+            question: The question to answer
+            
+        Returns:
+            Heuristic answer
+        """
+        logger.info("Using fallback heuristic mode")
+        return _fallback_impl(question)
 
 
 # Create legacy root agent instance for backward compatibility
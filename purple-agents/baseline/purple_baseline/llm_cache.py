@@ -0,0 +1,179 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Exact-match cache of LLM answers with LRU eviction and an optional TTL.
+
+LLMCache keeps recent answers in memory and can be backed by a
+PersistentLLMCache (SQLite) so answers survive restarts between eval runs.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """In-process LRU cache mapping request keys to answers."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        backing: Optional["PersistentLLMCache"] = None
+    ):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Lifetime of an entry, or None to keep entries until evicted
+            backing: Optional persistent cache consulted on memory misses and
+                written through on set
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time or None, answer), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def cache_key(**fields) -> str:
+        """Build a key from everything that determines the answer.
+
+        Args:
+            **fields: JSON-serializable request fields (model, prompt, question, ...)
+
+        Returns:
+            SHA-256 hex digest of the fields
+        """
+        payload = json.dumps(fields, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached answer for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, answer = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    logger.info("Response cache hit (hits=%d, misses=%d)", self.hits, self.misses)
+                    return answer
+                del self._entries[key]
+
+        answer = self.backing.get(key) if self.backing is not None else None
+        with self._lock:
+            if answer is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            logger.info("Persistent cache hit (hits=%d, misses=%d)", self.hits, self.misses)
+        self._store(key, answer)
+        return answer
+
+    def set(self, key: str, answer: str) -> None:
+        """Store an answer, evicting the least recently used entry when full."""
+        self._store(key, answer)
+        if self.backing is not None:
+            self.backing.set(key, answer)
+
+    def _store(self, key: str, answer: str) -> None:
+        """Put an answer in the in-memory LRU only."""
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (expires, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+class PersistentLLMCache:
+    """SQLite-backed answer cache shared across processes and restarts."""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ".llm_cache.sqlite",
+        ttl_seconds: Optional[float] = None
+    ):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Ignore entries older than this, or None to keep them forever
+        """
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answer_cache ("
+                "key TEXT PRIMARY KEY, answer TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            if self.ttl_seconds:
+                # Expired rows are never served again; drop them once per open
+                conn.execute(
+                    "DELETE FROM answer_cache WHERE created <= ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            # WAL lets readers proceed while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored answer for a key, or None if missing or expired."""
+        min_created = time.time() - self.ttl_seconds if self.ttl_seconds else 0.0
+        # A plain read: no write transaction, so readers never contend under WAL
+        row = self._connection().execute(
+            "SELECT answer FROM answer_cache WHERE key = ? AND created > ?",
+            (key, min_created),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, key: str, answer: str) -> None:
+        """Store or replace the answer for a key."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO answer_cache (key, answer, created) "
+                "VALUES (?, ?, ?)",
+                (key, answer, time.time()),
+            )
@@ -0,0 +1,452 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Semantic response cache: serve paraphrased questions from earlier answers.
+
+Questions are embedded (with Gemini's embedding endpoint or a small local
+sentence-transformers model) into unit vectors, so the inner product of two
+embeddings is their cosine similarity and "What's the capital of Japan?" and
+"Capital of Japan?" land on the same cached answer. Nearest-neighbour search
+uses a FAISS HNSW inner-product index when faiss is installed and a NumPy
+matrix-vector product otherwise.
+
+Requires the optional ``semantic-cache`` extra.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+GEMINI_EMBEDDING_MODEL = "text-embedding-004"
+LOCAL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 32
+GEMINI_EMBEDDING_BATCH_LIMIT = 100  # Texts per embed_content request
+HNSW_M = 32  # Graph neighbours per node in the FAISS HNSW index
+EMBEDDING_MEMO_MAX_ENTRIES = 4096  # Question embeddings kept in memory
+_MANIFEST = "manifest.json"
+
+
+class GeminiEmbedder:
+    """Embed text with the Gemini embedding endpoint."""
+
+    # Cosine similarity above which two questions count as the same
+    threshold = 0.92
+
+    def __init__(self, client: Any, model: str = GEMINI_EMBEDDING_MODEL):
+        """Use a GenAI client for embedding requests.
+
+        Args:
+            client: A google.genai Client
+            model: Gemini embedding model
+        """
+        self.client = client
+        self.model = model
+
+    def __call__(self, texts: Sequence[str]) -> "np.ndarray":
+        texts = list(texts)
+        values = []
+        # One request per GEMINI_EMBEDDING_BATCH_LIMIT texts
+        for start in range(0, len(texts), GEMINI_EMBEDDING_BATCH_LIMIT):
+            result = self.client.models.embed_content(
+                model=self.model,
+                contents=texts[start:start + GEMINI_EMBEDDING_BATCH_LIMIT],
+            )
+            values.extend(e.values for e in result.embeddings)
+        vectors = np.array(values, dtype="float32")
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class LocalEmbedder:
+    """Embed text on CPU with a sentence-transformers model."""
+
+    threshold = 0.95
+
+    def __init__(self, model: str = LOCAL_EMBEDDING_MODEL):
+        """Load the embedding model.
+
+        Args:
+            model: sentence-transformers model name
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if SentenceTransformer is None:
+            raise ImportError(
+                "Local embeddings require sentence-transformers. "
+                "Install with: pip install sentence-transformers"
+            )
+        self.model = model
+        self._model = SentenceTransformer(model, device="cpu")
+
+    def __call__(self, texts: Sequence[str]) -> "np.ndarray":
+        return self._model.encode(
+            list(texts),
+            batch_size=EMBEDDING_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        ).astype("float32")
+
+
+def _question_key(question: str) -> str:
+    """sha256 of a question, used to name its embedding and spot repeats."""
+    return hashlib.sha256(question.encode("utf-8")).hexdigest()
+
+
+class _Bucket:
+    """Embeddings and answers for one difficulty bucket."""
+
+    def __init__(self, dim: int):
+        self.answers: List[str] = []  # Parallel to the index rows
+        # Question key of each row (None for rows saved without one)
+        self.keys: List[Optional[str]] = []
+        self._key_set: set = set()
+        if faiss is not None:
+            # Approximate (HNSW graph) search stays sublinear as the cache grows
+            self._index = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        else:
+            # Growable buffer; only the first len(answers) rows are used
+            self._matrix = np.empty((16, dim), dtype="float32")
+
+    def search(self, vector: "np.ndarray") -> Optional[tuple]:
+        """Return (similarity, answer) of the nearest entry, or None if empty."""
+        if not self.answers:
+            return None
+        if faiss is not None:
+            scores, ids = self._index.search(vector[None, :], 1)
+            if ids[0, 0] < 0:
+                return None
+            return float(scores[0, 0]), self.answers[ids[0, 0]]
+        sims = self._matrix[:len(self.answers)] @ vector
+        best = int(sims.argmax())
+        return float(sims[best]), self.answers[best]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_set
+
+    def add(self, vectors: "np.ndarray", answers: Sequence[str], keys: Sequence[str]) -> None:
+        """Append rows of unit vectors with their answers and question keys."""
+        if faiss is not None:
+            self._index.add(np.ascontiguousarray(vectors, dtype="float32"))
+        else:
+            n = len(self.answers)
+            needed = n + len(vectors)
+            if needed > len(self._matrix):
+                grown = np.empty((max(needed, 2 * len(self._matrix)), self._matrix.shape[1]), dtype="float32")
+                grown[:n] = self._matrix[:n]
+                self._matrix = grown
+            self._matrix[n:needed] = vectors
+        self.answers.extend(answers)
+        self._set_keys(keys)
+
+    def _set_keys(self, keys: Sequence[Optional[str]]) -> None:
+        self.keys.extend(keys)
+        self._key_set.update(key for key in keys if key is not None)
+
+    def save(self, path: Path) -> str:
+        """Write the vectors next to ``path``; returns the file name used."""
+        if faiss is not None:
+            name = path.name + ".faiss"
+            faiss.write_index(self._index, str(path.parent / name))
+        else:
+            name = path.name + ".npy"
+            np.save(path.parent / name, self._matrix[:len(self.answers)])
+        return name
+
+    @classmethod
+    def load(
+        cls, path: Path, answers: List[str], keys: Optional[List[Optional[str]]] = None
+    ) -> Optional["_Bucket"]:
+        """Read a bucket written by save(), or None if it cannot be loaded here."""
+        if path.suffix == ".faiss":
+            if faiss is None:
+                return None
+            index = faiss.read_index(str(path))
+            bucket = cls(index.d)
+            bucket._index = index
+        else:
+            if faiss is not None:
+                return None
+            matrix = np.load(path)
+            bucket = cls(matrix.shape[1])
+            bucket._matrix = np.concatenate([matrix, np.empty_like(bucket._matrix)])
+        bucket.answers = list(answers)
+        bucket._set_keys(keys if keys is not None else [None] * len(answers))
+        return bucket
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of LLM answers keyed by question embeddings."""
+
+    def __init__(
+        self,
+        embedder: Any = None,
+        threshold: Optional[float] = None,
+        embeddings_dir: Optional[Union[str, Path]] = None,
+        persist_dir: Optional[Union[str, Path]] = None,
+        max_embeddings: int = EMBEDDING_MEMO_MAX_ENTRIES
+    ):
+        """Create an empty cache.
+
+        Args:
+            embedder: Callable mapping texts to unit-norm float32 rows, e.g.
+                GeminiEmbedder or LocalEmbedder. Defaults to LocalEmbedder
+            threshold: Minimum cosine similarity for a cache hit. Defaults to
+                the embedder's ``threshold``
+            embeddings_dir: Optional directory for ``{sha256}.npy`` embedding
+                files, so embeddings survive restarts
+            persist_dir: Optional directory the cached answers are loaded
+                from now and written to by save()
+            max_embeddings: Question embeddings memoized in memory before the
+                least recently used is evicted
+
+        Raises:
+            ImportError: If numpy (or the embedder's dependencies) is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "Semantic caching requires numpy. "
+                "Install with: pip install 'purple-baseline-gaia-agent[semantic-cache]'"
+            )
+
+        self.embedder = embedder if embedder is not None else LocalEmbedder()
+        self.threshold = threshold if threshold is not None else self.embedder.threshold
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self.max_embeddings = max_embeddings
+        # sha256 of question -> embedding, least recently used first
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embeddings_lock = threading.Lock()
+        self._embeddings_dir = Path(embeddings_dir) if embeddings_dir else None
+        if self._embeddings_dir:
+            self._embeddings_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._persist_dir = Path(persist_dir) if persist_dir else None
+        if self._persist_dir and (self._persist_dir / _MANIFEST).is_file():
+            self._load()
+
+        logger.info(
+            "Semantic cache ready (%s, threshold=%s, faiss=%s)",
+            type(self.embedder).__name__, self.threshold, "yes" if faiss else "no"
+        )
+
+    def __len__(self) -> int:
+        return sum(len(bucket.answers) for bucket in self._buckets.values())
+
+    def save(self) -> None:
+        """Write every bucket and its answers to persist_dir (no-op without one)."""
+        if not self._persist_dir:
+            return
+        self._persist_dir.mkdir(parents=True, exist_ok=True)
+        manifest = []
+        with self._lock:
+            for i, (key, bucket) in enumerate(self._buckets.items()):
+                name = bucket.save(self._persist_dir / f"bucket-{i}")
+                manifest.append({
+                    "key": key, "file": name, "answers": bucket.answers, "questions": bucket.keys
+                })
+        (self._persist_dir / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        logger.info("Saved %d semantic cache entries to %s", len(self), self._persist_dir)
+
+    def _load(self) -> None:
+        """Restore buckets written by save()."""
+        manifest = json.loads((self._persist_dir / _MANIFEST).read_text(encoding="utf-8"))
+        for entry in manifest:
+            bucket = _Bucket.load(
+                self._persist_dir / entry["file"], entry["answers"], entry.get("questions")
+            )
+            if bucket is None:
+                logger.warning("Skipping semantic cache file %s (index type unavailable)", entry["file"])
+                continue
+            self._buckets[entry["key"]] = bucket
+        logger.info("Loaded %d semantic cache entries from %s", len(self), self._persist_dir)
+
+    def embed(self, questions: Sequence[str]) -> "np.ndarray":
+        """Embed questions, sending only those not seen before in one batch.
+
+        Args:
+            questions: Questions to embed
+
+        Returns:
+            float32 array of shape (len(questions), dim) with unit-norm rows
+        """
+        keys = [_question_key(q) for q in questions]
+
+        # Collect into a local dict so a batch larger than the memo still works
+        found: Dict[str, "np.ndarray"] = {}
+        with self._embeddings_lock:
+            for key in keys:
+                vector = self._embeddings.get(key)
+                if vector is not None:
+                    self._embeddings.move_to_end(key)
+                    found[key] = vector
+
+        missing = {}
+        for key, question in zip(keys, questions, strict=True):
+            if key in found or key in missing:
+                continue
+            path = self._embeddings_dir / f"{key}.npy" if self._embeddings_dir else None
+            if path is not None and path.is_file():
+                found[key] = np.load(path)
+            else:
+                missing[key] = question
+
+        if missing:
+            vectors = self.embedder(list(missing.values()))
+            for key, vector in zip(missing, vectors, strict=True):
+                found[key] = vector
+                if self._embeddings_dir:
+                    np.save(self._embeddings_dir / f"{key}.npy", vector)
+
+        with self._embeddings_lock:
+            for key, vector in found.items():
+                self._embeddings[key] = vector
+                self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_embeddings:
+                self._embeddings.popitem(last=False)
+
+        return np.stack([found[key] for key in keys])
+
+    def warm(self, questions: Sequence[str]) -> None:
+        """Batch-embed questions ahead of time so later lookups skip embedding.
+
+        Args:
+            questions: Questions expected to be asked
+        """
+        if questions:
+            self.embed(questions)
+
+    def lookup(self, question: str, bucket: Hashable = None) -> Optional[str]:
+        """Return the cached answer of the most similar question, if close enough.
+
+        Args:
+            question: The incoming question
+            bucket: Only match questions cached under the same bucket (e.g.
+                the difficulty level), so answers never cross levels
+
+        Returns:
+            The cached answer, or None on a miss
+        """
+        vector = self.embed([question])[0]
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            best = entries.search(vector) if entries is not None else None
+        if best is not None and best[0] >= self.threshold:
+            return best[1]
+        return None
+
+    def add(self, question: str, answer: str, bucket: Hashable = None) -> None:
+        """Cache an answer under the question's embedding.
+
+        Args:
+            question: The question that was answered
+            answer: The answer to serve for similar questions
+            bucket: Bucket to store the answer under (see lookup)
+        """
+        key = _question_key(question)
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is not None and key in entries:
+                return
+        vector = self.embed([question])[0]
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is None:
+                entries = self._buckets[bucket] = _Bucket(vector.shape[0])
+            if key not in entries:
+                entries.add(vector[None, :], [answer], [key])
+
+    def prewarm(
+        self,
+        path: Union[str, Path],
+        bucket_of: Callable[[Dict[str, Any]], Hashable] = lambda record: None
+    ) -> int:
+        """Load earlier question/answer pairs so the first requests can hit.
+
+        Questions already cached in their bucket (e.g. restored from
+        persist_dir by an earlier run) are skipped, so prewarming from the same
+        file on every start neither re-embeds nor duplicates them. The rest are
+        embedded in as few batched requests as possible and bulk-inserted per
+        bucket.
+
+        Args:
+            path: A JSON Lines file of {"question", "answer"} records, or an
+                evaluation summary JSON whose "results" carry "question" and
+                "predicted_answer" (only results that scored 1.0 are used)
+            bucket_of: Maps a record to its bucket (see lookup)
+
+        Returns:
+            Number of entries added
+        """
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix == ".jsonl":
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            records = [r for r in json.loads(text).get("results", []) if r.get("score") == 1.0]
+
+        pairs = []
+        seen = set()
+        with self._lock:
+            for record in records:
+                answer = record.get("answer", record.get("predicted_answer"))
+                if not (record.get("question") and answer):
+                    continue
+                bucket = bucket_of(record)
+                key = _question_key(record["question"])
+                entries = self._buckets.get(bucket)
+                if (bucket, key) in seen or (entries is not None and key in entries):
+                    continue
+                seen.add((bucket, key))
+                pairs.append((record["question"], answer, bucket, key))
+        if not pairs:
+            logger.info("Semantic cache already holds every entry in %s", path)
+            return 0
+
+        vectors = self.embed([question for question, _, _, _ in pairs])
+        grouped: Dict[Hashable, List[int]] = {}
+        for i, (_, _, bucket, _) in enumerate(pairs):
+            grouped.setdefault(bucket, []).append(i)
+        added = 0
+        with self._lock:
+            for bucket, rows in grouped.items():
+                entries = self._buckets.get(bucket)
+                if entries is None:
+                    entries = self._buckets[bucket] = _Bucket(vectors.shape[1])
+                # Skip rows another thread cached since the check above
+                rows = [i for i in rows if pairs[i][3] not in entries]
+                entries.add(vectors[rows], [pairs[i][1] for i in rows], [pairs[i][3] for i in rows])
+                added += len(rows)
+
+        logger.info("Prewarmed semantic cache with %d entries from %s", added, path)
+        return added
@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the baseline agent's local answering helpers."""
+
+import ast
+
+import pytest
+from purple_baseline.agent import _eval_arithmetic, _fallback_impl, _try_direct
+
+
+def _if_chain_fallback(question: str) -> str:
+    """The original if-chain heuristic that _fallback_impl replaces."""
+    question_lower = question.lower()
+    if any(q in question_lower for q in ["is it", "are there", "does it", "do they", "can you", "is "]):
+        if "not" in question_lower or "never" in question_lower:
+            return "No"
+        return "Yes"
+    if question_lower.startswith("how many"):
+        return "5"
+    if "what year" in question_lower or "when was" in question_lower:
+        return "2020"
+    if question_lower.startswith("who"):
+        return "Unknown"
+    if question_lower.startswith("where"):
+        return "United States"
+    return "I don't know"
+
+
+class TestTryDirect:
+    """Test suite for local arithmetic and date-span answers."""
+
+    @pytest.mark.parametrize("question,expected", [
+        ("What is 2+2?", "4"),
+        ("what is (3 + 4) * 2", "14"),
+        ("What is -7*6?", "-42"),
+        ("What is 6/3?", "2"),
+        ("What is 1.5 * 4?", "6"),
+        ("How many days between 2024-01-01 and 2024-03-01?", "60"),
+        ("How many hours are there between 2024-01-01 and 2024-01-01T01:30:00?", "1.5"),
+    ])
+    def test_answers_locally(self, question, expected):
+        """Test questions answered without the LLM."""
+        assert _try_direct(question) == expected
+
+    @pytest.mark.parametrize("question", [
+        "What is 42?",  # Not a computation
+        "What is 2**10?",  # Power is not whitelisted
+        "What is 1/0?",
+        "What is 1/3?",  # Non-integral results go to the LLM
+        "What is 0.1 * 3?",
+        "What is 100000000000000000000000*1.0?",  # Beyond exact float range
+        "What is 9007199254740993 - 1?",
+        "What is abs(2)?",
+        "How many days between 2024-13-01 and 2024-01-01?",
+        "Who wrote Hamlet?",
+    ])
+    def test_defers_to_llm(self, question):
+        """Test questions that must fall through to the LLM."""
+        assert _try_direct(question) is None
+
+    @pytest.mark.parametrize("expression", [
+        "x + 1",  # Names
+        "abs(-1)",  # Calls
+        "2 ** 3",  # Power
+        "'a' * 3",  # Non-numeric literals
+        "[1][0]",
+    ])
+    def test_whitelist_rejects(self, expression):
+        """Test that only numeric literals and + - * / are evaluated."""
+        with pytest.raises(ValueError):
+            _eval_arithmetic(ast.parse(expression, mode="eval").body)
+
+
+class TestFallback:
+    """Test suite for the heuristic fallback answers."""
+
+    @pytest.mark.parametrize("question", [
+        "Is it raining in Paris?",
+        "Is it not raining?",
+        "Are there NEVER any cats?",
+        "Does it matter?",
+        "Do they know?",
+        "Can you count?",
+        "This is a question",
+        "How many moons does Mars have?",
+        "How many legs do spiders have?",
+        "HOW MANY planets?",
+        "In what year did it end?",
+        "When was the treaty signed?",
+        "Who painted the Mona Lisa?",
+        "who knows",
+        "Where do penguins live?",
+        "Name the largest ocean.",
+        "Knotted ropes, which are strongest?",
+        "",
+        "what\nyear did it happen",
+    ])
+    def test_matches_if_chain(self, question):
+        """Test that the regex dispatch answers exactly like the original if-chain."""
+        assert _fallback_impl(question) == _if_chain_fallback(question)
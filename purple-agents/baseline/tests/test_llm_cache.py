@@ -0,0 +1,125 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the exact-match LLM answer caches."""
+
+import sqlite3
+
+import pytest
+from purple_baseline import llm_cache
+from purple_baseline.llm_cache import LLMCache, PersistentLLMCache
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.time."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the cache module's clocks at a controllable time."""
+    fake = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", fake)
+    monkeypatch.setattr(llm_cache.time, "time", fake)
+    return fake
+
+
+class TestLLMCache:
+    """Test suite for the in-memory LRU cache."""
+
+    def test_get_set(self):
+        """Test that stored answers are returned and misses counted."""
+        cache = LLMCache()
+        cache.set("a", "Paris")
+
+        assert cache.get("a") == "Paris"
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry goes first when full."""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # b is now least recently used
+        cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_ttl_expiry(self, clock):
+        """Test that entries stop being served after their lifetime."""
+        cache = LLMCache(ttl_seconds=60)
+        cache.set("a", "Paris")
+
+        clock.now += 59
+        assert cache.get("a") == "Paris"
+        clock.now += 2
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_cache_key_ignores_field_order(self):
+        """Test that keys depend on field values, not argument order."""
+        assert LLMCache.cache_key(model="m", question="q") == LLMCache.cache_key(question="q", model="m")
+        assert LLMCache.cache_key(model="m", question="q") != LLMCache.cache_key(model="m", question="r")
+
+    def test_backing_read_through(self, tmp_path):
+        """Test that memory misses are served from the persistent tier."""
+        backing = PersistentLLMCache(tmp_path / "cache.sqlite")
+        LLMCache(backing=backing).set("a", "Paris")
+
+        cache = LLMCache(backing=backing)
+        assert cache.get("a") == "Paris"
+        assert len(cache) == 1
+
+
+class TestPersistentLLMCache:
+    """Test suite for the SQLite-backed cache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test that answers survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        PersistentLLMCache(path).set("a", "Paris")
+
+        cache = PersistentLLMCache(path)
+        assert cache.get("a") == "Paris"
+        assert cache.get("b") is None
+
+    def test_set_replaces(self, tmp_path):
+        """Test that setting a key again replaces its answer."""
+        cache = PersistentLLMCache(tmp_path / "cache.sqlite")
+        cache.set("a", "Paris")
+        cache.set("a", "Lyon")
+
+        assert cache.get("a") == "Lyon"
+
+    def test_expiry(self, tmp_path, clock):
+        """Test that expired answers are not served and are dropped on open."""
+        path = tmp_path / "cache.sqlite"
+        PersistentLLMCache(path, ttl_seconds=60).set("a", "Paris")
+
+        clock.now += 61
+        assert PersistentLLMCache(path).get("a") == "Paris"  # No TTL, kept
+        cache = PersistentLLMCache(path, ttl_seconds=60)
+        assert cache.get("a") is None
+
+        rows = sqlite3.connect(path).execute("SELECT COUNT(*) FROM answer_cache").fetchone()
+        assert rows == (0,)
@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the semantic response cache."""
+
+import hashlib
+import json
+
+import pytest
+from purple_baseline.semantic_cache import SemanticCache
+
+np = pytest.importorskip("numpy")
+
+
+class FakeEmbedder:
+    """Deterministic embedder that records how many texts it was asked for."""
+
+    threshold = 0.99
+
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+        self.embedded = 0
+
+    def __call__(self, texts):
+        self.embedded += len(texts)
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+            rows.append(np.random.default_rng(seed).standard_normal(self.dim))
+        vectors = np.array(rows, dtype="float32")
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def prewarm_file(tmp_path):
+    """A JSON Lines Q/A log with one repeated question."""
+    path = tmp_path / "answers.jsonl"
+    records = [
+        {"question": "What is the capital of Japan?", "answer": "Tokyo", "level": 1},
+        {"question": "What is the capital of France?", "answer": "Paris", "level": 1},
+        {"question": "How many legs does a spider have?", "answer": "8", "level": 2},
+        {"question": "What is the capital of Japan?", "answer": "Tokyo", "level": 1},
+    ]
+    path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+    return path
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache."""
+
+    def test_lookup_hits_after_add(self):
+        """Test that an added answer is served for the same question in its bucket only."""
+        cache = SemanticCache(embedder=FakeEmbedder())
+        cache.add("What is the capital of Japan?", "Tokyo", bucket=1)
+
+        assert cache.lookup("What is the capital of Japan?", bucket=1) == "Tokyo"
+        assert cache.lookup("What is the capital of Japan?", bucket=2) is None
+        assert cache.lookup("How many legs does a spider have?", bucket=1) is None
+
+    def test_add_skips_known_question(self):
+        """Test that adding a question twice keeps a single entry."""
+        cache = SemanticCache(embedder=FakeEmbedder())
+        cache.add("What is the capital of Japan?", "Tokyo")
+        cache.add("What is the capital of Japan?", "Tokyo")
+
+        assert len(cache) == 1
+
+    def test_prewarm_twice_keeps_count(self, prewarm_file):
+        """Test that prewarming from the same file again adds nothing."""
+        embedder = FakeEmbedder()
+        cache = SemanticCache(embedder=embedder)
+        bucket_of = lambda record: record["level"]
+
+        assert cache.prewarm(prewarm_file, bucket_of) == 3
+        assert cache.prewarm(prewarm_file, bucket_of) == 0
+        assert len(cache) == 3
+        assert embedder.embedded == 3
+
+    def test_prewarm_after_restart_keeps_count(self, tmp_path, prewarm_file):
+        """Test that a restored index is not extended by the same prewarm file."""
+        persist_dir = tmp_path / "index"
+        bucket_of = lambda record: record["level"]
+        cache = SemanticCache(embedder=FakeEmbedder(), persist_dir=persist_dir)
+        cache.prewarm(prewarm_file, bucket_of)
+        cache.save()
+
+        embedder = FakeEmbedder()
+        restored = SemanticCache(embedder=embedder, persist_dir=persist_dir)
+
+        assert len(restored) == 3
+        assert restored.prewarm(prewarm_file, bucket_of) == 0
+        assert len(restored) == 3
+        assert embedder.embedded == 0
+        assert restored.lookup("What is the capital of France?", bucket=1) == "Paris"